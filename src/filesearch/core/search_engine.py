@@ -11,6 +11,7 @@ import time
 from collections.abc import Callable, Generator
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from stat import S_ISDIR
 from typing import Any
 
 from loguru import logger
@@ -393,15 +394,16 @@ class FileSearchEngine(QObject):
                 for path in results:
                     try:
                         stat = path.stat()
+                        is_directory = S_ISDIR(stat.st_mode)
                         # Directories report 0 size for consistent UI ("Folder")
-                        size = 0 if path.is_dir() else stat.st_size
+                        size = 0 if is_directory else stat.st_size
                         yield {
                             "path": str(path),
                             "name": path.name,
                             "source": "filesystem",
                             "size": size,
                             "modified": stat.st_mtime,
-                            "is_directory": path.is_dir(),
+                            "is_directory": is_directory,
                         }
                     except Exception as e:
                         logger.error(f"Error getting stat for {path}: {e}")
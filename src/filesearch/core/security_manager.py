@@ -109,7 +109,8 @@ class SecurityManager:
             True if the file is potentially executable, False otherwise
         """
         try:
-            if not path.exists() or not path.is_file():
+            # is_file() is False for missing paths too, so one stat suffices
+            if not path.is_file():
                 return False
 
             # Check file extension
@@ -160,16 +161,17 @@ class SecurityManager:
         Returns:
             Tuple of (should_warn, warning_message)
         """
-        if not self.is_executable(path):
-            return False, ""
-
-        # Check user preferences
+        # Check user preferences first; an allowed extension never warns, so
+        # skip the filesystem checks in is_executable() entirely
         extension = path.suffix.lower()
 
         if extension in self._allowed_extensions:
             logger.debug(f"Extension {extension} is in allowed list, no warning needed")
             return False, ""
 
+        if not self.is_executable(path):
+            return False, ""
+
         if extension in self._blocked_extensions:
             logger.debug(f"Extension {extension} is in blocked list")
             return (
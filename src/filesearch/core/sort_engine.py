@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter
 
 from natsort import natsorted
 
@@ -62,8 +63,8 @@ class SortEngine:
         AC1 Implementation: Natural sorting with folder grouping
         """
         # Separate folders and files
-        folders = [r for r in results if r.path.is_dir()]
-        files = [r for r in results if not r.path.is_dir()]
+        folders = [r for r in results if r.is_directory]
+        files = [r for r in results if not r.is_directory]
 
         # Sort folders
         folder_names = [f.path.name for f in folders]
@@ -103,22 +104,17 @@ class SortEngine:
         AC2 Implementation: Size sorting with folder handling
         """
 
-        def _get_sort_key(result: SearchResult) -> tuple:
-            """Create sort key that handles folders appropriately."""
-            is_directory = result.path.is_dir()
-
-            if reverse:
-                # For descending (largest first):
-                # - Folders should go last, so return (1, size)
-                # - Files should sort by size (negative for descending)
-                return (1, 0) if is_directory else (0, -result.size)
-            else:
-                # For ascending (smallest first):
-                # - Folders should go first, so return (0, 0)
-                # - Files should sort by size
-                return (0, 0) if is_directory else (1, result.size)
+        # Folders keep their relative order; only files are compared, on a
+        # C-level attribute key (sorted stays stable with reverse=True)
+        folders = [r for r in results if r.is_directory]
+        files = sorted(
+            (r for r in results if not r.is_directory),
+            key=attrgetter("size"),
+            reverse=reverse,
+        )
 
-        return sorted(results, key=_get_sort_key)
+        # Ascending: folders first; descending (largest first): folders last
+        return files + folders if reverse else folders + files
 
     @staticmethod
     def sort_by_date(
@@ -135,7 +131,7 @@ class SortEngine:
 
         AC3 Implementation: Date sorting with timestamp comparison
         """
-        return sorted(results, key=lambda r: r.modified, reverse=not reverse)
+        return sorted(results, key=attrgetter("modified"), reverse=not reverse)
 
     @staticmethod
     def sort_by_type(
@@ -158,13 +154,12 @@ class SortEngine:
 
         def _get_type_sort_key(result: SearchResult) -> tuple:
             """Create sort key for type-based sorting."""
-            if result.path.is_dir():
+            if result.is_directory:
                 # Folders first, then sort by name
                 return (0, result.path.name.lower())
             else:
                 # Files second, group by extension then name
-                ext = result.path.suffix.lower()
-                return (1, ext, result.path.name.lower())
+                return (1, result.extension, result.path.name.lower())
 
         sorted_results = sorted(results, key=_get_type_sort_key)
 
@@ -195,31 +190,35 @@ class SortEngine:
         AC5 Implementation: Relevance scoring based on match quality
         """
         query_lower = query.lower()
+        query_length = len(query)
 
         def _calculate_relevance(result: SearchResult) -> float:
             """Calculate relevance score for a single result."""
-            filename_lower = result.path.name.lower()
+            filename = result.get_display_name()
+            filename_lower = filename.lower()
 
             if filename_lower == query_lower:
                 # Exact match - highest priority
                 return 100.0
 
-            if filename_lower.startswith(query_lower):
+            # One scan answers both "starts with" and "contains"
+            position = filename_lower.find(query_lower)
+
+            if position == 0:
                 # Starts with query - high priority
                 # Bonus for closer match length
-                length_ratio = len(query) / len(result.path.name)
+                length_ratio = query_length / len(filename)
                 return 80.0 + (length_ratio * 20.0)
 
-            if query_lower in filename_lower:
+            if position > 0:
                 # Contains query - medium priority
                 # Penalty based on position (earlier is better)
-                position = filename_lower.index(query_lower)
                 position_penalty = position / len(filename_lower) * 20.0
                 return 60.0 - position_penalty
 
             if filename_lower.endswith(query_lower):
                 # Ends with query - lower priority
-                length_ratio = len(query) / len(result.path.name)
+                length_ratio = query_length / len(filename)
                 return 40.0 + (length_ratio * 10.0)
 
             # No match - lowest priority
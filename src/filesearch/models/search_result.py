@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -10,20 +10,43 @@ class SearchResult:
     size: int  # File size in bytes (0 for directories)
     modified: float  # Modification timestamp
     plugin_source: str | None = None  # Plugin name if from plugin
+    # Directory flag when the producer already knows it; otherwise resolved
+    # with a single stat on first use of is_directory.
+    is_dir: bool | None = field(default=None, compare=False, repr=False)
+    # Formatted display strings and the lowercased extension, filled on first
+    # use; the delegate asks for them on every repaint.
+    _display_cache: dict[str, str] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
 
     def get_display_name(self) -> str:
         """Return filename for display"""
-        return self.path.name
+        display_name = self._display_cache.get("name")
+        if display_name is None:
+            display_name = self.path.name
+            self._display_cache["name"] = display_name
+        return display_name
 
     def get_display_path(self) -> str:
         """Return path with user directory abbreviated"""
-        try:
-            return str(self.path.relative_to(Path.home()))
-        except ValueError:
-            return str(self.path)
+        display_path = self._display_cache.get("path")
+        if display_path is None:
+            try:
+                display_path = str(self.path.relative_to(Path.home()))
+            except ValueError:
+                display_path = str(self.path)
+            self._display_cache["path"] = display_path
+        return display_path
 
     def get_display_size(self) -> str:
         """Return human-readable file size"""
+        display_size = self._display_cache.get("size")
+        if display_size is None:
+            display_size = self._format_size()
+            self._display_cache["size"] = display_size
+        return display_size
+
+    def _format_size(self) -> str:
         if self.size == 0:
             return "Folder"
 
@@ -36,16 +59,54 @@ class SearchResult:
 
     def get_display_date(self) -> str:
         """Return formatted modification date"""
-        from datetime import datetime
+        display_date = self._display_cache.get("date")
+        if display_date is None:
+            from datetime import datetime
+
+            try:
+                display_date = datetime.fromtimestamp(self.modified).strftime(
+                    "%b %d, %Y"
+                )
+            except (OverflowError, OSError, ValueError, TypeError):
+                # Out-of-range or missing timestamps from odd filesystems
+                display_date = "Unknown"
+            self._display_cache["date"] = display_date
+        return display_date
 
-        return datetime.fromtimestamp(self.modified).strftime("%b %d, %Y")
+    def get_tooltip(self) -> str:
+        """Return the multi-line tooltip shown when hovering the result"""
+        tooltip = self._display_cache.get("tooltip")
+        if tooltip is None:
+            tooltip = (
+                f"Filename: {self.get_display_name()}\n"
+                f"Path: {self.path}\n"
+                f"Size: {self.get_display_size()}\n"
+                f"Modified: {self.get_display_date()}"
+            )
+            self._display_cache["tooltip"] = tooltip
+        return tooltip
+
+    def clear_display_cache(self) -> None:
+        """Drop memoized display strings after the result is modified"""
+        self._display_cache.clear()
 
     @property
     def filename(self) -> str:
         """Return the filename (convenience property)."""
         return self.path.name
 
+    @property
+    def extension(self) -> str:
+        """Return the lowercased suffix, e.g. ".txt" (cached; "" if none)."""
+        ext = self._display_cache.get("ext")
+        if ext is None:
+            ext = self.path.suffix.lower()
+            self._display_cache["ext"] = ext
+        return ext
+
     @property
     def is_directory(self) -> bool:
         """Check if the result is a directory (convenience property)."""
-        return self.path.is_dir()
+        if self.is_dir is None:
+            self.is_dir = self.path.is_dir()
+        return self.is_dir
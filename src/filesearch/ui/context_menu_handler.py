@@ -1,11 +1,12 @@
 """Context menu handler mixin for MainWindow."""
 
+from collections.abc import Callable
 from enum import Enum
 from typing import TYPE_CHECKING, cast
 
 from loguru import logger
 from PyQt6.QtCore import QPoint, Qt
-from PyQt6.QtGui import QAction
+from PyQt6.QtGui import QAction, QKeySequence
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -75,6 +76,7 @@ class ContextMenuHandlerMixin:
     - self._on_file_open_requested(SearchResult): method
     - self.open_selected_folder(Path): method
     - self.config_manager: ConfigManager instance
+    - self._pause_ui_timers() / self._resume_ui_timers(): methods
     """
 
     # Alias the enum on the class so self.ContextMenuAction works unchanged
@@ -88,6 +90,10 @@ class ContextMenuHandlerMixin:
 
         def _on_file_open_requested(self, result: SearchResult) -> None: ...
 
+        def _pause_ui_timers(self) -> None: ...
+
+        def _resume_ui_timers(self) -> None: ...
+
     def _host_widget(self) -> QMainWindow:
         """Return the QMainWindow that hosts this mixin."""
         if not isinstance(self, QMainWindow):
@@ -109,6 +115,26 @@ class ContextMenuHandlerMixin:
             "List of files matching the search query. Use arrow keys to "
             "navigate, Enter to open, and Context Menu key for options."
         )
+        # The menu is built once on first use and reconfigured per request.
+        self._context_menu: QMenu | None = None
+        self._context_menu_selection: list[SearchResult] = []
+        self._context_handlers: (
+            dict[_ContextMenuAction, Callable[[list[SearchResult]], None]] | None
+        ) = None
+
+    def _prewarm_context_menu(self) -> None:
+        """Build the context menu and its icons ahead of the first right-click.
+
+        Scheduled on an idle timer by the host so the standard icon lookups
+        do not delay the first menu popup.
+        """
+        self._get_context_menu()
+
+    def _get_context_menu(self) -> QMenu:
+        """Return the shared context menu, building it on first use."""
+        if self._context_menu is None:
+            self._context_menu = self._build_context_menu()
+        return self._context_menu
 
     def _on_context_menu_requested(self, pos: QPoint) -> None:
         """Handles the request to display a context menu for search results.
@@ -122,10 +148,18 @@ class ContextMenuHandlerMixin:
             return
 
         menu = self._create_context_menu(selected_results)
-        menu.exec(pos)
+        # Periodic UI refreshes would repaint behind the modal menu.
+        self._pause_ui_timers()
+        try:
+            menu.exec(pos)
+        finally:
+            self._resume_ui_timers()
 
     def _create_context_menu(self, selected_results: list[SearchResult]) -> QMenu:
-        """Creates and populates the context menu based on selected results.
+        """Prepares the shared context menu for the selected results.
+
+        The menu and its actions are created once; subsequent calls only
+        update which actions are available for the current selection.
 
         Args:
             selected_results: A list of SearchResult objects currently selected.
@@ -133,134 +167,144 @@ class ContextMenuHandlerMixin:
         Returns:
             A QMenu instance ready to be displayed.
         """
+        menu = self._get_context_menu()
+        self._context_menu_selection = selected_results
+
+        # AC11: Multi-Selection Support
+        is_single_selection = len(selected_results) == 1
+        self._open_with_action.setEnabled(is_single_selection)
+        self._properties_action.setEnabled(is_single_selection)
+        self._rename_action.setEnabled(is_single_selection)
+
+        return menu
+
+    def _build_context_menu(self) -> QMenu:
+        """Creates the context menu and its actions.
+
+        Every action carries its ContextMenuAction in ``data()`` and is
+        connected to the single ``_dispatch_context_action`` slot.
+
+        Returns:
+            A QMenu instance with every context menu action attached.
+        """
         menu = QMenu(self._host_widget())
+        menu.triggered.connect(self._dispatch_context_action)
+        self._context_action_handlers()
 
         # AC1: Open (default action, bold text)
-        open_action = _require_action(
-            menu.addAction(
-                self._host_style().standardIcon(
-                    QStyle.StandardPixmap.SP_DialogOpenButton
-                ),
-                self.ContextMenuAction.OPEN.value,
-            )
-        )
-        open_action.triggered.connect(
-            lambda: self._on_context_menu_action(self.ContextMenuAction.OPEN)
+        open_action = self._add_context_action(
+            menu, QStyle.StandardPixmap.SP_DialogOpenButton, self.ContextMenuAction.OPEN
         )
         font = open_action.font()
         font.setBold(True)
         open_action.setFont(font)
 
         # AC4: Open With... Submenu
-        open_with_menu = QMenu("Open With...", self._host_widget())
-        open_with_action = _require_action(menu.addMenu(open_with_menu))
-        open_with_action.setIcon(
+        self._open_with_menu = QMenu("Open With...", self._host_widget())
+        self._open_with_action = _require_action(menu.addMenu(self._open_with_menu))
+        self._open_with_action.setIcon(
             self._host_style().standardIcon(QStyle.StandardPixmap.SP_DesktopIcon)
         )
-
-        if len(selected_results) == 1:
-            open_with_menu.aboutToShow.connect(
-                lambda: self._populate_open_with_menu(
-                    open_with_menu, selected_results[0]
-                )
-            )
-        else:
-            open_with_action.setEnabled(False)
+        self._open_with_menu.aboutToShow.connect(self._on_open_with_menu_about_to_show)
 
         # AC5: Open Containing Folder
-        open_folder_action = _require_action(
-            menu.addAction(
-                self._host_style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon),
-                self.ContextMenuAction.OPEN_CONTAINING_FOLDER.value,
-            )
-        )
-        open_folder_action.triggered.connect(
-            lambda: self._on_context_menu_action(
-                self.ContextMenuAction.OPEN_CONTAINING_FOLDER
-            )
+        self._add_context_action(
+            menu,
+            QStyle.StandardPixmap.SP_DirOpenIcon,
+            self.ContextMenuAction.OPEN_CONTAINING_FOLDER,
+            "Ctrl+Shift+O",
         )
-        open_folder_action.setShortcut("Ctrl+Shift+O")
 
         menu.addSeparator()
 
         # AC6: Copy Path to Clipboard
-        copy_path_action = _require_action(
-            menu.addAction(
-                self._host_style().standardIcon(
-                    QStyle.StandardPixmap.SP_DialogSaveButton
-                ),
-                self.ContextMenuAction.COPY_PATH_TO_CLIPBOARD.value,
-            )
-        )
-        copy_path_action.triggered.connect(
-            lambda: self._on_context_menu_action(
-                self.ContextMenuAction.COPY_PATH_TO_CLIPBOARD
-            )
+        self._add_context_action(
+            menu,
+            QStyle.StandardPixmap.SP_DialogSaveButton,
+            self.ContextMenuAction.COPY_PATH_TO_CLIPBOARD,
+            "Ctrl+Shift+C",
         )
-        copy_path_action.setShortcut("Ctrl+Shift+C")
 
         # AC7: Copy File to Clipboard
-        copy_file_action = _require_action(
-            menu.addAction(
-                self._host_style().standardIcon(QStyle.StandardPixmap.SP_FileIcon),
-                self.ContextMenuAction.COPY_FILE_TO_CLIPBOARD.value,
-            )
-        )
-        copy_file_action.triggered.connect(
-            lambda: self._on_context_menu_action(
-                self.ContextMenuAction.COPY_FILE_TO_CLIPBOARD
-            )
+        self._add_context_action(
+            menu,
+            QStyle.StandardPixmap.SP_FileIcon,
+            self.ContextMenuAction.COPY_FILE_TO_CLIPBOARD,
         )
 
         menu.addSeparator()
 
         # AC8: Properties Dialog
-        properties_action = _require_action(
-            menu.addAction(
-                self._host_style().standardIcon(
-                    QStyle.StandardPixmap.SP_MessageBoxInformation
-                ),
-                self.ContextMenuAction.PROPERTIES.value,
-            )
-        )
-        properties_action.triggered.connect(
-            lambda: self._on_context_menu_action(self.ContextMenuAction.PROPERTIES)
+        self._properties_action = self._add_context_action(
+            menu,
+            QStyle.StandardPixmap.SP_MessageBoxInformation,
+            self.ContextMenuAction.PROPERTIES,
+            "Alt+Return",
         )
-        properties_action.setShortcut("Alt+Return")
 
         # AC9: Delete with Confirmation
-        delete_action = _require_action(
-            menu.addAction(
-                self._host_style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon),
-                self.ContextMenuAction.DELETE.value,
-            )
-        )
-        delete_action.triggered.connect(
-            lambda: self._on_context_menu_action(self.ContextMenuAction.DELETE)
+        self._add_context_action(
+            menu,
+            QStyle.StandardPixmap.SP_TrashIcon,
+            self.ContextMenuAction.DELETE,
+            QKeySequence(Qt.Key.Key_Delete),
         )
-        delete_action.setShortcut(Qt.Key.Key_Delete)
 
         # AC10: Rename with Validation
-        rename_action = _require_action(
-            menu.addAction(
-                self._host_style().standardIcon(
-                    QStyle.StandardPixmap.SP_LineEditClearButton
-                ),
-                self.ContextMenuAction.RENAME.value,
-            )
+        self._rename_action = self._add_context_action(
+            menu,
+            QStyle.StandardPixmap.SP_LineEditClearButton,
+            self.ContextMenuAction.RENAME,
+            QKeySequence(Qt.Key.Key_F2),
         )
-        rename_action.triggered.connect(
-            lambda: self._on_context_menu_action(self.ContextMenuAction.RENAME)
+
+        return menu
+
+    def _add_context_action(
+        self,
+        menu: QMenu,
+        pixmap: QStyle.StandardPixmap,
+        action: _ContextMenuAction,
+        shortcut: QKeySequence | str | None = None,
+    ) -> QAction:
+        """Add a dispatchable action to the context menu.
+
+        Args:
+            menu: The menu receiving the action.
+            pixmap: Standard icon shown next to the action text.
+            action: The ContextMenuAction stored in the action's data.
+            shortcut: Optional shortcut displayed for the action.
+
+        Returns:
+            The created QAction.
+        """
+        menu_action = _require_action(
+            menu.addAction(self._host_style().standardIcon(pixmap), action.value)
         )
-        rename_action.setShortcut(Qt.Key.Key_F2)
+        menu_action.setData(action)
+        if shortcut is not None:
+            menu_action.setShortcut(shortcut)
+        return menu_action
 
-        # AC11: Multi-Selection Support
-        is_single_selection = len(selected_results) == 1
-        open_with_action.setEnabled(is_single_selection)
-        properties_action.setEnabled(is_single_selection)
-        rename_action.setEnabled(is_single_selection)
+    def _dispatch_context_action(self, menu_action: QAction) -> None:
+        """Route a triggered context menu action to its handler.
 
-        return menu
+        Args:
+            menu_action: The triggered QAction; its data holds the
+                ContextMenuAction to run. Submenu entries carry no data.
+        """
+        action = menu_action.data()
+        if isinstance(action, _ContextMenuAction):
+            selected_results = self._context_menu_selection
+            self._context_menu_selection = []
+            self._on_context_menu_action(action, selected_results)
+
+    def _on_open_with_menu_about_to_show(self) -> None:
+        """Populate the Open With submenu for the current single selection."""
+        if len(self._context_menu_selection) == 1:
+            self._populate_open_with_menu(
+                self._open_with_menu, self._context_menu_selection[0]
+            )
 
     def _populate_open_with_menu(self, menu: QMenu, result: SearchResult) -> None:
         """Populate the Open With submenu with available applications.
@@ -318,36 +362,49 @@ class ContextMenuHandlerMixin:
             app_info = {"name": executable.name, "command": str(executable)}
             self._handle_open_with_app(app_info, result)
 
-    def _on_context_menu_action(self, action: _ContextMenuAction) -> None:
+    def _context_action_handlers(
+        self,
+    ) -> dict[_ContextMenuAction, Callable[[list[SearchResult]], None]]:
+        """Return the action-to-handler map, building it on first use."""
+        if self._context_handlers is None:
+            self._context_handlers = {
+                self.ContextMenuAction.OPEN: self._handle_context_open,
+                self.ContextMenuAction.OPEN_WITH: self._handle_context_open_with,
+                self.ContextMenuAction.OPEN_CONTAINING_FOLDER: (
+                    self._handle_context_open_containing_folder
+                ),
+                self.ContextMenuAction.COPY_PATH_TO_CLIPBOARD: (
+                    self._handle_context_copy_path
+                ),
+                self.ContextMenuAction.COPY_FILE_TO_CLIPBOARD: (
+                    self._handle_context_copy_file
+                ),
+                self.ContextMenuAction.PROPERTIES: self._handle_context_properties,
+                self.ContextMenuAction.DELETE: self._handle_context_delete,
+                self.ContextMenuAction.RENAME: self._handle_context_rename,
+            }
+        return self._context_handlers
+
+    def _on_context_menu_action(
+        self,
+        action: _ContextMenuAction,
+        selected_results: list[SearchResult] | None = None,
+    ) -> None:
         """Routes context menu actions to their respective handlers.
 
         Args:
             action: The ContextMenuAction enum value representing the chosen action.
+            selected_results: Selection captured when the menu was opened. When
+                omitted, the current results view selection is used.
         """
-        selected_results = _selected_results(self.results_view)
+        if selected_results is None:
+            selected_results = _selected_results(self.results_view)
 
         if not selected_results:
             self.safe_status_message("No item selected for action.")
             return
 
-        handler_map = {
-            self.ContextMenuAction.OPEN: self._handle_context_open,
-            self.ContextMenuAction.OPEN_WITH: self._handle_context_open_with,
-            self.ContextMenuAction.OPEN_CONTAINING_FOLDER: (
-                self._handle_context_open_containing_folder
-            ),
-            self.ContextMenuAction.COPY_PATH_TO_CLIPBOARD: (
-                self._handle_context_copy_path
-            ),
-            self.ContextMenuAction.COPY_FILE_TO_CLIPBOARD: (
-                self._handle_context_copy_file
-            ),
-            self.ContextMenuAction.PROPERTIES: self._handle_context_properties,
-            self.ContextMenuAction.DELETE: self._handle_context_delete,
-            self.ContextMenuAction.RENAME: self._handle_context_rename,
-        }
-
-        handler = handler_map.get(action)
+        handler = self._context_action_handlers().get(action)
         if handler:
             try:
                 handler(selected_results)
@@ -11,6 +11,7 @@ from typing import Any
 
 from loguru import logger
 from PyQt6.QtCore import (  # noqa: F401
+    QElapsedTimer,
     QKeyCombination,
     QModelIndex,
     QPoint,
@@ -22,9 +23,11 @@ from PyQt6.QtCore import (  # noqa: F401
 from PyQt6.QtGui import (  # noqa: F401
     QAction,
     QCloseEvent,
+    QHideEvent,
     QIcon,
     QKeySequence,
     QShortcut,
+    QShowEvent,
 )
 from PyQt6.QtWidgets import (
     QApplication,
@@ -50,6 +53,7 @@ from filesearch.core.file_utils import (
 )
 from filesearch.core.runtime_paths import get_app_icon_path
 from filesearch.core.search_engine import FileSearchEngine
+from filesearch.core.security_manager import get_security_manager
 from filesearch.core.sort_engine import SortCriteria
 from filesearch.models.search_result import SearchResult
 from filesearch.plugins.plugin_manager import PluginManager
@@ -64,7 +68,6 @@ from filesearch.ui.search_controls import (
     StatusWidget,
 )
 from filesearch.ui.search_worker import SearchWorker
-from filesearch.ui.settings_dialog import SettingsDialog
 from filesearch.ui.sidebar_widget import SidebarWidget
 from filesearch.ui.sort_controls import SortControls
 from filesearch.ui.storage_tab import StorageTabWidget
@@ -88,7 +91,7 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
     Attributes:
         config_manager (ConfigManager): Configuration manager instance
         search_engine (FileSearchEngine): Search engine instance
-        search_worker (Optional[SearchWorker]): Current search worker thread
+        search_worker (Optional[SearchWorker]): Current search worker
         is_searching (bool): Whether a search is currently active
     """
 
@@ -127,15 +130,26 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
         self.config_manager = config_manager or ConfigManager(runtime=runtime)
         self.plugin_manager = plugin_manager or PluginManager(self.config_manager)
         self.search_engine = FileSearchEngine(config_manager=self.config_manager)
+        # Executable warnings for file opens; resolved once, not per open
+        self._security_manager = get_security_manager(self.config_manager)
         self.search_worker: SearchWorker | None = None
         self.is_searching = False
-        self.search_results: list[dict[str, Any]] = []
+        self.search_results: list[SearchResult] = []
         self.plugin_results: list[dict[str, Any]] = []
         self.current_directory = self._get_startup_directory()
-        self.search_start_time = 0.0
+        self.search_start_time = QElapsedTimer()
         self._active_search_request: SearchRequest | None = None
         self._pending_search_request: SearchRequest | None = None
         self._cancel_requested = False
+        self._wait_cursor_active = False
+        # Progress messages reuse a prefix built once per search
+        self._progress_status_prefix = "Found "
+        # Throttled status updates: the latest message waiting for the timer
+        self._pending_status: str | None = None
+        self._status_throttle_timer = QTimer(self)
+        self._status_throttle_timer.setSingleShot(True)
+        self._status_throttle_timer.setInterval(100)  # At most ~10 updates/s
+        self._status_throttle_timer.timeout.connect(self._flush_pending_status)
         # Browse history for Back navigation (most recent previous folders last)
         self._directory_history: list[Path] = []
         self._max_directory_history = 50
@@ -148,8 +162,9 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
         # Set focus to search input on launch
         self.query_input.set_focus()
 
-        # Setup context menu actions
+        # Setup context menu actions; build the menu once the event loop is idle
         self._setup_context_menu()
+        QTimer.singleShot(0, self._prewarm_context_menu)
 
         # Idle: show current folder contents instead of a blank results pane
         self._show_idle_folder_listing()
@@ -327,10 +342,10 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
             self.line_col_label = QLabel("Ln 1, Col 1")
             status_bar.addPermanentWidget(self.line_col_label)
 
-        # Timer for updating time
-        self.time_update_timer = QTimer()
+        # Timer for updating time; runs only while the window is shown
+        self.time_update_timer = QTimer(self)
+        self.time_update_timer.setInterval(1000)  # Update every second
         self.time_update_timer.timeout.connect(self._update_status_time)
-        self.time_update_timer.start(1000)  # Update every second
 
         logger.debug("UI setup completed")
 
@@ -402,12 +417,34 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
 
         logger.debug("Signals connected")
 
-    def safe_status_message(self, message: str) -> None:
-        """Safely show message on status bar, handling potential None return."""
+    def safe_status_message(self, message: str, *, throttle: bool = False) -> None:
+        """Safely show message on status bar, handling potential None return.
+
+        Args:
+            message: Text to show
+            throttle: Coalesce rapid updates (e.g. streaming progress) so the
+                status bar repaints at most every 100 ms; the latest message
+                wins. Unthrottled messages show immediately and replace any
+                throttled message still waiting.
+        """
+        if throttle and self._status_throttle_timer.isActive():
+            self._pending_status = message
+            return
+
+        self._pending_status = None
+        if throttle:
+            self._status_throttle_timer.start()
+
         status_bar = self.statusBar()
         if status_bar is not None:
             status_bar.showMessage(message)
 
+    def _flush_pending_status(self) -> None:
+        """Show the latest throttled status message, if one is waiting."""
+        message = self._pending_status
+        if message is not None:
+            self.safe_status_message(message, throttle=True)
+
     def load_window_settings(self) -> None:
         """Load window settings from configuration."""
         try:
@@ -423,6 +460,8 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
 
     def _update_status_time(self) -> None:
         """Update the current time display in status bar."""
+        if not self.time_label.isVisible():
+            return
         current_time = time.strftime("%H:%M:%S")
         self.time_label.setText(current_time)
 
@@ -494,6 +533,10 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
 
     def show_settings_dialog(self) -> None:
         """Show the settings dialog."""
+        # Imported on first use; the dialog and its pages are not needed to
+        # show the main window.
+        from filesearch.ui.settings_dialog import SettingsDialog
+
         dialog = SettingsDialog(
             self.config_manager,
             self.plugin_manager,
@@ -511,39 +554,31 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
     def _load_highlight_settings(self) -> None:
         """Load and apply highlight settings from configuration."""
         try:
-            # Load highlight settings if the results view supports it
-            if hasattr(self.results_view, "set_highlight_enabled"):
-                enabled = self.config_manager.get("highlighting.enabled", True)
-                self.results_view.set_highlight_enabled(enabled)
+            enabled = self.config_manager.get("highlighting.enabled", True)
+            self.results_view.set_highlight_enabled(enabled)
 
-                color = self.config_manager.get("highlighting.color", "#FFFF99")
-                if hasattr(self.results_view, "set_highlight_color"):
-                    self.results_view.set_highlight_color(color)
+            color = self.config_manager.get("highlighting.color", "#FFFF99")
+            self.results_view.set_highlight_color(color)
 
-                case_sensitive = self.config_manager.get(
-                    "highlighting.case_sensitive", False
-                )
-                if hasattr(self.results_view, "set_highlight_case_sensitive"):
-                    self.results_view.set_highlight_case_sensitive(case_sensitive)
+            case_sensitive = self.config_manager.get(
+                "highlighting.case_sensitive", False
+            )
+            self.results_view.set_highlight_case_sensitive(case_sensitive)
 
-                logger.debug("Highlight settings loaded")
+            logger.debug("Highlight settings loaded")
         except Exception as e:
             logger.error(f"Error loading highlight settings: {e}")
 
     def _load_sort_settings(self) -> None:
         """Load and apply sort settings from configuration."""
         try:
-            # Load sort criteria from config
-            from filesearch.core.sort_engine import SortCriteria
-
             criteria_str = self.config_manager.get("sorting.criteria", "name_asc")
 
             # Convert string to SortCriteria enum
             criteria = SortCriteria(criteria_str)
 
             # Apply to sort controls
-            if hasattr(self.sort_controls, "set_criteria"):
-                self.sort_controls.set_criteria(criteria)
+            self.sort_controls.set_criteria(criteria)
 
             logger.debug(f"Sort settings loaded: {criteria_str}")
         except Exception as e:
@@ -873,6 +908,8 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
 
     def start_search(self, *_args: object) -> None:
         """Start the file search operation."""
+        # A path typed moments ago may still be waiting on its validation
+        self.directory_selector.flush_pending_validation()
         search_request = self._get_current_search_request()
         if search_request is None:
             return
@@ -898,8 +935,8 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
         self.search_results.clear()
         self.results_view.set_searching_state()
 
-        # Record search start time
-        self.search_start_time = time.time()
+        # Record search start time (monotonic)
+        self.search_start_time.start()
 
         # Update UI state
         self.is_searching = True
@@ -910,7 +947,8 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
         self.query_input.set_loading_state(True)
         self.query_input.set_error_state(False)
         self.directory_selector.set_read_only(True)
-        self.setCursor(Qt.CursorShape.WaitCursor)  # Change cursor to wait
+        self._set_wait_cursor(True)
+        self._progress_status_prefix = f"Searching {directory}... Found "
         self.safe_status_message(f"Searching in {directory}...")
         logger.info(f"Search started: '{query}' in {directory}")
 
@@ -918,13 +956,12 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
         self.search_worker = SearchWorker(self.search_engine, directory, query)
 
         # Connect search worker signals to slots
-        self.search_worker.result_found.connect(self.on_result_found)
-        self.search_worker.progress_update.connect(self.on_progress_update)
-        self.search_worker.search_complete.connect(self.on_search_complete)
-        self.search_worker.error_occurred.connect(self.on_search_error)
-        self.search_worker.search_stopped.connect(self.on_search_stopped)
+        self.search_worker.signals.results_found.connect(self.on_results_found)
+        self.search_worker.signals.search_complete.connect(self.on_search_complete)
+        self.search_worker.signals.error_occurred.connect(self.on_search_error)
+        self.search_worker.signals.search_stopped.connect(self.on_search_stopped)
 
-        # Start the search in background thread
+        # Start the search on a pooled background thread
         self.search_worker.start()
 
     def stop_search(self) -> None:
@@ -932,54 +969,31 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
         self._pending_search_request = None
         self._request_search_cancel()
 
-    def on_result_found(self, result: dict, result_number: int) -> None:
-        """Handle search result found signal.
+    def on_results_found(self, results: list[SearchResult], files_found: int) -> None:
+        """Handle a batch of search results from the worker.
 
         Args:
-            result: Result dictionary
-            result_number: Result number
+            results: SearchResult objects built by the worker thread
+            files_found: Running total of files found
         """
         if self._cancel_requested:
             return
 
-        self.search_results.append(result)
-
-        # Create SearchResult and add to results view
-        search_result = SearchResult(
-            path=Path(result["path"]),
-            size=result["size"],
-            modified=result["modified"],
-            plugin_source=result.get("source"),
-        )
-        self.results_view.add_result(search_result)
-
-        # Update status periodically
-        if result_number % 10 == 0:
-            self.safe_status_message(f"Found {result_number} files...")
-
-        logger.debug(f"Result found: {result} (#{result_number})")
-
-    def on_progress_update(
-        self, progress: int, current_dir: str, files_found: int
-    ) -> None:
-        """Handle progress update signal.
-
-        Args:
-            progress: Progress percentage
-            current_dir: Current directory being searched
-            files_found: Number of files found so far
-        """
-        if self._cancel_requested:
-            return
+        self.search_results.extend(results)
+        self.results_view.add_results(results)
 
         self.safe_status_message(
-            f"Searching {current_dir}... Found {files_found} files"
+            self._progress_status_prefix + str(files_found) + " files", throttle=True
         )
-        logger.debug(f"Progress: {progress}% in {current_dir}, {files_found} files")
 
     def _finish_search_worker(self) -> tuple[float, SearchRequest | None]:
         """Reset worker/UI state and return terminal-search metadata."""
-        duration = time.time() - self.search_start_time
+        duration = (
+            self.search_start_time.elapsed() / 1000.0
+            if self.search_start_time.isValid()
+            else 0.0
+        )
+        self.search_start_time.invalidate()
         search_request = self._active_search_request
         self.reset_search_ui()
 
@@ -1026,11 +1040,13 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
             )
             self.safe_status_message(f"Search stopped: {total_files} files found")
             logger.info(
-                f"Search stopped after completion race: {total_files} files in "
-                f"{total_dirs} directories"
+                "Search stopped after completion race: {} files in {} directories",
+                total_files,
+                total_dirs,
             )
             return
 
+        self._apply_final_sort()
         self.progress_widget.set_completed_state(total_files)
         self.status_widget.update_status(
             "completed",
@@ -1040,19 +1056,11 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
             duration=duration,
         )
         self.safe_status_message(f"Found {total_files} results in {duration:.1f}s")
-        # Auto-scroll to first result when search completes
-        if (
-            hasattr(self.results_view, "_results_model")
-            and self.results_view._results_model
-            and self.results_view._results_model.rowCount() > 0
-        ):
-            self.results_view.scrollTo(self.results_view._results_model.index(0, 0))
-
         # Refresh sidebar tags with latest search history
         self._update_sidebar_tags()
 
         logger.info(
-            f"Search completed: {total_files} files in {total_dirs} directories"
+            "Search completed: {} files in {} directories", total_files, total_dirs
         )
 
     def on_search_stopped(self, files_found: int, dirs_searched: int) -> None:
@@ -1074,6 +1082,7 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
             logger.info("Search cancelled after query was cleared")
             return
 
+        self._apply_final_sort()
         self.status_widget.update_status(
             "completed",
             files_found,
@@ -1083,9 +1092,17 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
         )
         self.safe_status_message(f"Search stopped: {files_found} files found")
         logger.info(
-            f"Search stopped: {files_found} files in {dirs_searched} directories"
+            "Search stopped: {} files in {} directories", files_found, dirs_searched
         )
 
+    def _apply_final_sort(self) -> None:
+        """Sort the streamed results once with the selected criteria.
+
+        Results are appended unsorted while the worker is running; sorting a
+        single time when the search ends avoids re-sorting on every batch.
+        """
+        self.results_view.apply_sorting(self.sort_controls.get_criteria())
+
     def on_search_error(self, error_message: str, error_code: int) -> None:
         """Handle search error signal.
 
@@ -1115,12 +1132,25 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
         self.search_control.set_state(SearchState.IDLE)
         self.query_input.set_loading_state(False)
         self.directory_selector.set_read_only(False)
-        self.setCursor(Qt.CursorShape.ArrowCursor)  # Reset cursor to normal
+        self._set_wait_cursor(False)
 
         if self.search_worker:
             self.search_worker = None
 
-        logger.debug("Search UI reset")
+    def _set_wait_cursor(self, active: bool) -> None:
+        """Push or pop the application-wide wait cursor for a running search.
+
+        The override cursor is a single application-level swap, unlike
+        ``setCursor`` which notifies every child widget. Pushes and pops are
+        kept paired so the override stack never leaks a wait cursor.
+        """
+        if active == self._wait_cursor_active:
+            return
+        self._wait_cursor_active = active
+        if active:
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        else:
+            QApplication.restoreOverrideCursor()
 
     def open_selected_file(self, file_path: Path) -> None:
         """Open the selected file with default application.
@@ -1131,7 +1161,7 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
         try:
             self.desktop_effects.open_file(file_path)
             self.safe_status_message(f"Opened: {file_path.name}")
-            logger.info(f"Opened file: {file_path}")
+            logger.debug("Opened file: {}", file_path)
         except FileSearchError as e:
             self.safe_status_message(f"Error opening file: {e}")
             logger.error(f"Error opening file {file_path}: {e}")
@@ -1151,7 +1181,7 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
             self.desktop_effects.reveal_file(file_path)
             opened = file_path if file_path.is_dir() else file_path.parent
             self.safe_status_message(f"Opened folder: {opened}")
-            logger.info(f"Opened folder: {opened}")
+            logger.debug("Opened folder: {}", opened)
         except FileSearchError as e:
             self.safe_status_message(f"Error opening folder: {e}")
             logger.error(f"Error opening folder for {file_path}: {e}")
@@ -1191,7 +1221,7 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
         system file manager.
         """
         try:
-            if search_result.path.is_dir():
+            if search_result.is_directory:
                 self._navigate_into_directory(search_result.path)
             else:
                 self.open_selected_folder(search_result.path)
@@ -1210,14 +1240,11 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
         """
         try:
             # Folders: navigate in-app (browse into folder)
-            if search_result.path.is_dir():
+            if search_result.is_directory:
                 self._navigate_into_directory(search_result.path)
                 return
 
-            # Get security manager for executable warnings
-            from filesearch.core.security_manager import get_security_manager
-
-            security_manager = get_security_manager(self.config_manager)
+            security_manager = self._security_manager
 
             # Check if file is executable and should warn
             should_warn, warning_message = security_manager.should_warn_before_opening(
@@ -1264,7 +1291,7 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
 
             # Show success status
             self.safe_status_message(f"Opened: {file_path.name}")
-            logger.info(f"Successfully opened file: {file_path}")
+            logger.debug("Successfully opened file: {}", file_path)
 
             # Add to recently opened files
             self.config_manager.add_recent_file(file_path)
@@ -1301,12 +1328,34 @@ class MainWindow(ContextMenuHandlerMixin, QMainWindow):
             if confirmed:
                 self.open_selected_folder(file_path)
 
+    def showEvent(self, event: QShowEvent | None) -> None:
+        """Resume the status bar clock when the window becomes visible."""
+        super().showEvent(event)
+        self._resume_ui_timers()
+
+    def hideEvent(self, event: QHideEvent | None) -> None:
+        """Pause the status bar clock while the window is hidden or minimized."""
+        self._pause_ui_timers()
+        super().hideEvent(event)
+
+    def _pause_ui_timers(self) -> None:
+        """Stop periodic UI refresh timers."""
+        self.time_update_timer.stop()
+
+    def _resume_ui_timers(self) -> None:
+        """Restart periodic UI refresh timers if the window is visible."""
+        if not self.isVisible():
+            return
+        self._update_status_time()
+        self.time_update_timer.start()
+
     def closeEvent(self, event: QCloseEvent | None) -> None:
         """Handle window close event."""
         self.save_window_settings()
         if self.search_worker:
             self.search_worker.stop()
             self.search_worker.wait()
+        self._set_wait_cursor(False)
         self.storage_tab.cleanup()
         if self._owns_config_manager:
             self.config_manager.close()
@@ -1,25 +1,32 @@
 """Custom delegate for rendering search result items with highlighting."""
 
-from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
 
 import qtawesome as qta  # type: ignore[import-untyped]  # qtawesome has no typing metadata.
 from PyQt6.QtCore import QModelIndex, QObject, QRect, QSize, Qt
-from PyQt6.QtGui import QColor, QFont, QPainter, QPixmap
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPen,
+    QPixmap,
+)
 from PyQt6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
 
 from filesearch.models.search_result import SearchResult
 from filesearch.utils.highlight_engine import HighlightEngine
 
 
-def _get_file_icon_info(path: Path) -> tuple[str, str]:
-    """Return (qta icon name, color hex) for a file path."""
+@lru_cache(maxsize=256)
+def _get_file_icon_info(ext: str, is_dir: bool) -> tuple[str, str]:
+    """Return (qta icon name, color hex) for a lowercased suffix."""
     from filesearch.ui.theme import Colors as C
 
-    if path.is_dir():
+    if is_dir:
         return "mdi6.folder", C.FILE_FOLDER
 
-    ext = path.suffix.lower()
     _map = {
         ".pdf": ("mdi6.file-pdf-box", C.FILE_PDF),
         ".doc": ("mdi6.file-word", C.FILE_DOC),
@@ -76,22 +83,48 @@ def _get_file_icon_info(path: Path) -> tuple[str, str]:
     return _map.get(ext, ("mdi6.file", C.TEXT_SECONDARY))
 
 
-# Pixmap cache for file-type icons (key = "icon_name:color")
-_icon_pixmap_cache: dict[str, QPixmap] = {}
-
-
-def _get_file_icon_pixmap(path: Path, size: int = 20) -> QPixmap:
+@lru_cache(maxsize=256)
+def _get_file_icon_pixmap(ext: str, is_dir: bool, size: int = 20) -> QPixmap:
     """Return a cached QPixmap for the file type."""
-    icon_name, color = _get_file_icon_info(path)
-    key = f"{icon_name}:{color}:{size}"
-    if key not in _icon_pixmap_cache:
-        _icon_pixmap_cache[key] = qta.icon(icon_name, color=color).pixmap(size, size)
-    return _icon_pixmap_cache[key]
+    icon_name, color = _get_file_icon_info(ext, is_dir)
+    return qta.icon(icon_name, color=color).pixmap(size, size)
+
+
+# Emoji fallback icons used by ResultsItemDelegate.get_file_type_icon
+_DIR_EMOJI = "\U0001f4c1"
+_DEFAULT_FILE_EMOJI = "\U0001f4c4"
+_FILE_TYPE_EMOJI: dict[str, str] = {
+    ".txt": "\U0001f4c4",
+    ".pdf": "\U0001f4d5",
+    ".doc": "\U0001f4c4",
+    ".docx": "\U0001f4c4",
+    ".jpg": "\U0001f4f7",
+    ".jpeg": "\U0001f4f7",
+    ".png": "\U0001f5bc\ufe0f",
+    ".gif": "\U0001f4f7",
+    ".mp4": "\U0001f4fd\ufe0f",
+    ".avi": "\U0001f4fd\ufe0f",
+    ".mp3": "\U0001f3b5",
+    ".wav": "\U0001f3b5",
+    ".zip": "\U0001f4e6",
+    ".rar": "\U0001f4e6",
+    ".exe": "\u2699\ufe0f",
+    ".py": "\U0001f40d",
+    ".js": "\U0001f4dc",
+    ".html": "\U0001f310",
+    ".css": "\U0001f3a8",
+}
 
 
 class ResultsItemDelegate(QStyledItemDelegate):
     """Custom delegate for rendering search result items with highlighting support"""
 
+    # Upper bound on filenames with memoized highlight segments
+    _MAX_SEGMENTS_CACHE = 4096
+
+    # View state bits that pick the row background
+    _ROW_STATE_MASK = QStyle.StateFlag.State_Selected | QStyle.StateFlag.State_MouseOver
+
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
         from filesearch.ui.theme import Colors, Fonts, Spacing
@@ -103,46 +136,51 @@ class ResultsItemDelegate(QStyledItemDelegate):
         self.size_font = QFont("Segoe UI", Fonts.SIZE_XS)
         self.size_font.setWeight(QFont.Weight.Medium)
         self.date_font = QFont("Segoe UI", Fonts.SIZE_XS)
+        # Metrics used to elide filename and path text to the row width
+        self._filename_metrics = QFontMetrics(self.filename_font)
+        self._path_metrics = QFontMetrics(self.path_font)
+        # Highlight runs and widths per filename for the current query
+        self._segments_cache: dict[str, list[tuple[str, bool, int]]] = {}
+        # Metrics for the size pill and date, measured without the painter
+        self._size_metrics = QFontMetrics(self.size_font)
+        self._date_metrics = QFontMetrics(self.date_font)
 
-        self.icon_cache: dict[str, str] = {}
         self.highlight_engine = HighlightEngine()
         self.current_query: str | None = None
         self.highlight_color = Colors.HIGHLIGHT_BG
         self.highlight_text_color = Colors.HIGHLIGHT_TEXT
         self.highlight_enabled = True
+        self.highlight_case_sensitive = False
         self.highlight_style = "background"  # background, outline, or underline
+        self._highlight_foreground = QColor(self.highlight_text_color)
+        self._rebuild_highlight_objects()
 
-        # Cache theme colors
-        self._colors = Colors
+        # Cache theme spacing
         self._spacing = Spacing
-
-    def get_file_type_icon(self, path: Path) -> str:
-        """Get file type icon based on extension with caching (legacy fallback)"""
-        if path.is_dir():
-            return self.icon_cache.setdefault("dir", "\U0001f4c1")
-        ext = path.suffix.lower()
-        icon_map = {
-            ".txt": "\U0001f4c4",
-            ".pdf": "\U0001f4d5",
-            ".doc": "\U0001f4c4",
-            ".docx": "\U0001f4c4",
-            ".jpg": "\U0001f4f7",
-            ".jpeg": "\U0001f4f7",
-            ".png": "\U0001f5bc\ufe0f",
-            ".gif": "\U0001f4f7",
-            ".mp4": "\U0001f4fd\ufe0f",
-            ".avi": "\U0001f4fd\ufe0f",
-            ".mp3": "\U0001f3b5",
-            ".wav": "\U0001f3b5",
-            ".zip": "\U0001f4e6",
-            ".rar": "\U0001f4e6",
-            ".exe": "\u2699\ufe0f",
-            ".py": "\U0001f40d",
-            ".js": "\U0001f4dc",
-            ".html": "\U0001f310",
-            ".css": "\U0001f3a8",
+        # Spacious items with room for pill and separator
+        self._size_hint = QSize(400, 64)
+
+        # Theme colors used on every paint, parsed once
+        self._separator_color = QColor(Colors.ITEM_SEPARATOR)
+        self._pill_border_color = QColor(Colors.BORDER_DEFAULT)
+        self._pill_bg_color = QColor(Colors.SIZE_PILL_BG)
+        self._text_primary_color = QColor(Colors.TEXT_PRIMARY)
+        self._text_secondary_color = QColor(Colors.TEXT_SECONDARY)
+        self._text_tertiary_color = QColor(Colors.TEXT_TERTIARY)
+
+        # Row background per masked view state; selection wins over hover
+        selected_brush = QBrush(QColor(Colors.ITEM_SELECTED_BG))
+        self._row_brushes = {
+            QStyle.StateFlag.State_Selected: selected_brush,
+            QStyle.StateFlag.State_MouseOver: QBrush(QColor(Colors.ITEM_HOVER_BG)),
+            self._ROW_STATE_MASK: selected_brush,
         }
-        return self.icon_cache.setdefault(ext, icon_map.get(ext, "\U0001f4c4"))
+
+    def get_file_type_icon(self, result: SearchResult) -> str:
+        """Get file type icon based on extension (legacy fallback)"""
+        if result.is_directory:
+            return _DIR_EMOJI
+        return _FILE_TYPE_EMOJI.get(result.extension, _DEFAULT_FILE_EMOJI)
 
     def paint(
         self,
@@ -153,27 +191,30 @@ class ResultsItemDelegate(QStyledItemDelegate):
         """Custom paint method for result items with polished theme styling"""
         if painter is None:
             return
-        painter.save()
 
-        # Get the SearchResult from the model
-        result = index.data(Qt.ItemDataRole.UserRole)
-        if not isinstance(result, SearchResult):
+        # Get the SearchResult from the model. The empty-state placeholder row
+        # has none; the base delegate paints it and manages painter state itself
+        result: SearchResult | None = index.data(Qt.ItemDataRole.UserRole)
+        if result is None:
             super().paint(painter, option, index)
-            painter.restore()
             return
 
-        C = self._colors
+        # Only font, pen and brush change below; restoring just those is
+        # cheaper than a full save()/restore() of the painter state
+        old_font = painter.font()
+        old_pen = painter.pen()
+        old_brush = painter.brush()
+
         pad = self._spacing.PADDING_ITEM
 
         # Draw background based on state
-        if option.state & QStyle.StateFlag.State_Selected:
-            painter.fillRect(option.rect, QColor(C.ITEM_SELECTED_BG))
-        elif option.state & QStyle.StateFlag.State_MouseOver:
-            painter.fillRect(option.rect, QColor(C.ITEM_HOVER_BG))
+        row_brush = self._row_brushes.get(option.state & self._ROW_STATE_MASK)
+        if row_brush is not None:
+            painter.fillRect(option.rect, row_brush)
 
         # Draw subtle separator line at bottom
         sep_y = option.rect.bottom()
-        painter.setPen(QColor(C.ITEM_SEPARATOR))
+        painter.setPen(self._separator_color)
         painter.drawLine(
             option.rect.left() + pad, sep_y, option.rect.right() - pad, sep_y
         )
@@ -183,7 +224,9 @@ class ResultsItemDelegate(QStyledItemDelegate):
 
         # --- Icon (QtAwesome pixmap) ---
         icon_size = 20
-        icon_pixmap = _get_file_icon_pixmap(result.path, icon_size)
+        icon_pixmap = _get_file_icon_pixmap(
+            result.extension, result.is_directory, icon_size
+        )
         icon_x = rect.left()
         icon_y = rect.top() + 2
         painter.drawPixmap(icon_x, icon_y, icon_pixmap)
@@ -192,22 +235,20 @@ class ResultsItemDelegate(QStyledItemDelegate):
 
         # === Right side: Size pill and date ===
         size_text = result.get_display_size()
-        painter.setFont(self.size_font)
-        size_fm = painter.fontMetrics()
-        pill_text_width = size_fm.horizontalAdvance(size_text)
-        pill_h = size_fm.height() + 6
+        pill_text_width = self._size_metrics.horizontalAdvance(size_text)
+        pill_h = self._size_metrics.height() + 6
         pill_w = pill_text_width + self._spacing.PADDING_PILL * 2
         pill_x = rect.right() - pill_w
         pill_y = rect.top() + 2
 
         # Draw pill background with subtle border
         pill_rect = QRect(pill_x, pill_y, pill_w, pill_h)
-        painter.setPen(QColor(C.BORDER_DEFAULT))
-        painter.setBrush(QColor(C.SIZE_PILL_BG))
+        painter.setPen(self._pill_border_color)
+        painter.setBrush(self._pill_bg_color)
         painter.drawRoundedRect(pill_rect, 5, 5)
 
         # Draw pill text
-        painter.setPen(QColor(C.TEXT_SECONDARY))
+        painter.setPen(self._text_secondary_color)
         painter.setFont(self.size_font)
         painter.drawText(
             pill_rect,
@@ -216,21 +257,17 @@ class ResultsItemDelegate(QStyledItemDelegate):
         )
 
         # Date (right-aligned below pill)
-        try:
-            date_text = datetime.fromtimestamp(result.modified).strftime("%b %d, %Y")
-        except Exception:
-            date_text = "Unknown"
+        date_text = result.get_display_date()
 
         painter.setFont(self.date_font)
-        date_fm = painter.fontMetrics()
-        date_w = date_fm.horizontalAdvance(date_text)
+        date_w = self._date_metrics.horizontalAdvance(date_text)
         date_rect = QRect(
             rect.right() - date_w,
             pill_y + pill_h + 4,
             date_w,
-            date_fm.height(),
+            self._date_metrics.height(),
         )
-        painter.setPen(QColor(C.TEXT_TERTIARY))
+        painter.setPen(self._text_tertiary_color)
         painter.drawText(
             date_rect,
             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop,
@@ -242,22 +279,25 @@ class ResultsItemDelegate(QStyledItemDelegate):
 
         # Filename
         filename_rect = QRect(content_left, rect.top(), filename_width, 20)
-        filename = result.get_display_name()
-        if len(filename) > 80:
-            filename = filename[:77] + "..."
-
-        # Use highlighting if query is set
-        if (
-            self.current_query
-            and self.highlight_enabled
-            and self.highlight_engine.has_matches(filename, self.current_query)
-        ):
-            self._draw_highlighted_text(
-                painter, filename_rect, filename, self.current_query
+        filename = self._filename_metrics.elidedText(
+            result.get_display_name(), Qt.TextElideMode.ElideRight, filename_width
+        )
+
+        # Use highlighting if query is set and matches the (elided) filename
+        matches = (
+            self.highlight_engine.find_matches(
+                filename,
+                self.current_query,
+                case_sensitive=self.highlight_case_sensitive,
             )
+            if self.current_query and self.highlight_enabled
+            else None
+        )
+        if matches:
+            self._draw_highlighted_text(painter, filename_rect, filename, matches)
         else:
             painter.setFont(self.filename_font)
-            painter.setPen(QColor(C.TEXT_PRIMARY))
+            painter.setPen(self._text_primary_color)
             painter.drawText(
                 filename_rect,
                 Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
@@ -267,26 +307,32 @@ class ResultsItemDelegate(QStyledItemDelegate):
         # Path (below filename)
         path_rect = QRect(content_left, filename_rect.bottom() + 2, filename_width, 16)
         painter.setFont(self.path_font)
-        path = result.get_display_path()
-        if len(path) > 80:
-            path = "..." + path[-77:]
-        painter.setPen(QColor(C.TEXT_TERTIARY))
+        path = self._path_metrics.elidedText(
+            result.get_display_path(), Qt.TextElideMode.ElideLeft, filename_width
+        )
+        painter.setPen(self._text_tertiary_color)
         painter.drawText(
             path_rect,
             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
             path,
         )
 
-        painter.restore()
+        painter.setFont(old_font)
+        painter.setPen(old_pen)
+        painter.setBrush(old_brush)
 
     def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
         """Return the size hint for items"""
-        return QSize(400, 64)  # Spacious items with room for pill and separator
+        return self._size_hint
 
     def set_query(self, query: str) -> None:
         """Set the current search query for highlighting"""
+        if query == self.current_query:
+            # Re-running or refreshing a search keeps its cached matches
+            return
         self.current_query = query
         self.highlight_engine.clear_cache()
+        self._segments_cache.clear()
 
     def set_highlight_enabled(self, enabled: bool) -> None:
         """Enable or disable highlighting"""
@@ -295,94 +341,96 @@ class ResultsItemDelegate(QStyledItemDelegate):
     def set_highlight_color(self, color: str) -> None:
         """Set the highlight color (HTML color code)"""
         self.highlight_color = color
+        self._rebuild_highlight_objects()
+
+    def _rebuild_highlight_objects(self) -> None:
+        """Parse the highlight color into the brush and pen used while painting"""
+        color = QColor(self.highlight_color)
+        self._highlight_brush = QBrush(color)
+        self._highlight_pen = QPen(color)
+        self._highlight_pen.setWidth(2)
 
     def set_highlight_style(self, style: str) -> None:
         """Set the highlight style ('background', 'outline', or 'underline')"""
         self.highlight_style = style
 
-    def _draw_highlighted_text(
-        self, painter: QPainter, rect: QRect, text: str, query: str
-    ) -> None:
-        """Draw text with highlighted matching portions using theme colors"""
-        if not text or not query or not self.highlight_enabled:
-            painter.drawText(
-                rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, text
-            )
-            return
-
-        matches = self.highlight_engine.find_matches(text, query, case_sensitive=False)
+    def set_highlight_case_sensitive(self, case_sensitive: bool) -> None:
+        """Set whether highlighting matches the query case-sensitively"""
+        self.highlight_case_sensitive = case_sensitive
+        self._segments_cache.clear()
 
-        if not matches:
-            painter.drawText(
-                rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, text
-            )
-            return
+    def _highlight_segments(
+        self, text: str, matches: list[tuple[int, int]]
+    ) -> list[tuple[str, bool, int]]:
+        """Split ``text`` into (segment, is_match, width) runs (memoized)
 
-        painter.save()
+        ``matches`` are the (start, end) spans that
+        HighlightEngine.find_matches found in the name part of ``text``;
+        the extension is always a trailing non-match segment.
+        """
+        segments = self._segments_cache.get(text)
+        if segments is not None:
+            return segments
 
-        C = self._colors
         name_without_ext, ext = self.highlight_engine._split_filename_and_ext(text)
-
-        x = rect.left()
-        y = rect.top()
-
+        advance = self._filename_metrics.horizontalAdvance
+        segments = []
         last_end = 0
-
         for start, end in matches:
-            # Draw non-matching text before this match
             if start > last_end:
                 normal_text = name_without_ext[last_end:start]
-                painter.setFont(self.filename_font)
-                painter.setPen(QColor(C.TEXT_PRIMARY))
-                painter.drawText(x, y, normal_text)
-                x += painter.fontMetrics().horizontalAdvance(normal_text)
+                segments.append((normal_text, False, advance(normal_text)))
+            if end > start:
+                # Zero-width regex matches would draw an empty highlight
+                match_text = name_without_ext[start:end]
+                segments.append((match_text, True, advance(match_text)))
+            last_end = end
+        if last_end < len(name_without_ext):
+            remaining_text = name_without_ext[last_end:]
+            segments.append((remaining_text, False, advance(remaining_text)))
+        if ext:
+            segments.append((ext, False, advance(ext)))
 
-            # Draw highlighted matching text
-            match_text = name_without_ext[start:end]
-            painter.setFont(self.filename_font)
+        if len(self._segments_cache) >= self._MAX_SEGMENTS_CACHE:
+            self._segments_cache.clear()
+        self._segments_cache[text] = segments
+        return segments
 
-            bw = painter.fontMetrics().horizontalAdvance(match_text)
-            bh = painter.fontMetrics().height()
+    def _draw_highlighted_text(
+        self,
+        painter: QPainter,
+        rect: QRect,
+        text: str,
+        matches: list[tuple[int, int]],
+    ) -> None:
+        """Draw text with highlighted matching portions using theme colors
 
-            if self.highlight_style == "background":
+        Leaves the filename font, pen and brush set; paint() resets them.
+        """
+        x = rect.left()
+        y = rect.top()
+        # Every segment is drawn in the filename font
+        painter.setFont(self.filename_font)
+        bh = self._filename_metrics.height()
+
+        for segment, is_match, width in self._highlight_segments(text, matches):
+            if not is_match:
+                painter.setPen(self._text_primary_color)
+            elif self.highlight_style == "background":
                 # Rounded rect highlight with warm amber
-                highlight_rect = QRect(x - 1, y - bh + 2, bw + 2, bh)
+                highlight_rect = QRect(x - 1, y - bh + 2, width + 2, bh)
                 painter.setPen(Qt.PenStyle.NoPen)
-                painter.setBrush(QColor(self.highlight_color))
+                painter.setBrush(self._highlight_brush)
                 painter.drawRoundedRect(highlight_rect, 3, 3)
-                painter.setPen(QColor(self.highlight_text_color))
+                painter.setPen(self._highlight_foreground)
             elif self.highlight_style == "outline":
-                pen = painter.pen()
-                pen.setColor(QColor(self.highlight_color))
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawRoundedRect(x, y - bh, bw, bh, 3, 3)
-                painter.setPen(QColor(C.TEXT_PRIMARY))
+                painter.setPen(self._highlight_pen)
+                painter.drawRoundedRect(x, y - bh, width, bh, 3, 3)
+                painter.setPen(self._text_primary_color)
             elif self.highlight_style == "underline":
-                pen = painter.pen()
-                pen.setColor(QColor(self.highlight_color))
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawLine(x, y, x + bw, y)
-                painter.setPen(QColor(C.TEXT_PRIMARY))
-
-            painter.drawText(x, y, match_text)
-            x += bw
-
-            last_end = end
-
-        # Draw remaining non-matching text
-        if last_end < len(name_without_ext):
-            remaining_text = name_without_ext[last_end:]
-            painter.setFont(self.filename_font)
-            painter.setPen(QColor(C.TEXT_PRIMARY))
-            painter.drawText(x, y, remaining_text)
-            x += painter.fontMetrics().horizontalAdvance(remaining_text)
-
-        # Draw extension
-        if ext:
-            painter.setFont(self.filename_font)
-            painter.setPen(QColor(C.TEXT_PRIMARY))
-            painter.drawText(x, y, ext)
+                painter.setPen(self._highlight_pen)
+                painter.drawLine(x, y, x + width, y)
+                painter.setPen(self._text_primary_color)
 
-        painter.restore()
+            painter.drawText(x, y, segment)
+            x += width
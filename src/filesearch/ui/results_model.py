@@ -17,6 +17,7 @@ class ResultsModel(QAbstractListModel):
         super().__init__(parent)
         self._all_results: list[SearchResult] = []  # Unfiltered master list
         self._results: list[SearchResult] = []  # Filtered view
+        self._row_by_id: dict[int, int] = {}  # id(result) -> row in _results
         self._displayed_count = 0
         self._batch_size = 100  # Load 100 items at a time for smooth scrolling
         self._current_sort_criteria: SortCriteria | None = None
@@ -44,12 +45,7 @@ class ResultsModel(QAbstractListModel):
         elif role == Qt.ItemDataRole.UserRole:
             return result
         elif role == Qt.ItemDataRole.ToolTipRole:
-            return (
-                f"Filename: {result.path.name}\n"
-                f"Path: {result.path}\n"
-                f"Size: {result.get_display_size()}\n"
-                f"Modified: {result.get_display_date()}"
-            )
+            return result.get_tooltip()
 
         return None
 
@@ -81,6 +77,7 @@ class ResultsModel(QAbstractListModel):
 
             # Update result object
             result.path = new_path
+            result.clear_display_cache()
 
             # Emit data changed signal
             self.dataChanged.emit(
@@ -130,47 +127,72 @@ class ResultsModel(QAbstractListModel):
         self._displayed_count += items_to_fetch
         self.endInsertRows()
 
+    def set_batch_size(self, batch_size: int) -> None:
+        """Set how many rows are revealed per fetchMore (and at load time)"""
+        self._batch_size = max(1, batch_size)
+
     def add_result(self, result: SearchResult) -> None:
         """Add a single result to the model"""
-        self._all_results.append(result)
+        self.add_results([result])
 
-        # Check if result passes current filter
-        if (
-            self._extension_filter
-            and result.path.suffix.lower() not in self._extension_filter
-        ):
-            return  # Filtered out, don't add to visible list
+    def add_results(self, results: list[SearchResult]) -> None:
+        """Add a batch of results with a single row-insertion notification"""
+        self._all_results.extend(results)
 
-        self.beginInsertRows(QModelIndex(), len(self._results), len(self._results))
-        self._results.append(result)
+        # Only results passing the current filter reach the visible list
+        if self._extension_filter:
+            results = [r for r in results if r.extension in self._extension_filter]
+        if not results:
+            return
 
-        # Auto-fetch if we're still in initial loading phase
-        if (
-            self._displayed_count < len(self._results)
-            and len(self._results) <= self._displayed_count + self._batch_size
-        ):
-            self._displayed_count += 1
+        previous_count = len(self._results)
+        self._results.extend(results)
+        self._reindex_rows(previous_count)
 
-        self.endInsertRows()
+        # Auto-display while we're still in the initial loading phase; rows
+        # beyond that are left for fetchMore
+        displayed = self._displayed_count
+        if previous_count < displayed + self._batch_size:
+            self.beginInsertRows(QModelIndex(), displayed, displayed + len(results) - 1)
+            self._displayed_count = displayed + len(results)
+            self.endInsertRows()
 
     def remove_result(self, result: SearchResult) -> bool:
         """Remove a single result from the model"""
-        try:
-            idx = self._results.index(result)
-            self.beginRemoveRows(QModelIndex(), idx, idx)
-            self._results.pop(idx)
-            if idx < self._displayed_count:
-                self._displayed_count -= 1
-            self.endRemoveRows()
-            return True
-        except ValueError:
+        idx = self._row_by_id.pop(id(result), None)
+        if idx is None:
             return False
 
+        # Drop it from the master list too so sorting or refiltering cannot
+        # bring a deleted result back
+        for master_idx, candidate in enumerate(self._all_results):
+            if candidate is result:
+                del self._all_results[master_idx]
+                break
+
+        self.beginRemoveRows(QModelIndex(), idx, idx)
+        self._results.pop(idx)
+        self._reindex_rows(idx)
+        if idx < self._displayed_count:
+            self._displayed_count -= 1
+        self.endRemoveRows()
+        return True
+
+    def _reindex_rows(self, start: int = 0) -> None:
+        """Refresh the row lookup for results at or after ``start``"""
+        if start == 0:
+            self._row_by_id = {id(r): row for row, r in enumerate(self._results)}
+            return
+        row_by_id = self._row_by_id
+        for row in range(start, len(self._results)):
+            row_by_id[id(self._results[row])] = row
+
     def clear(self) -> None:
         """Clear all results from the model"""
         self.beginResetModel()
         self._all_results.clear()
         self._results.clear()
+        self._row_by_id.clear()
         self._displayed_count = 0
         self.endResetModel()
 
@@ -180,12 +202,11 @@ class ResultsModel(QAbstractListModel):
         self._all_results = list(results)
         if self._extension_filter:
             self._results = [
-                r
-                for r in self._all_results
-                if r.path.suffix.lower() in self._extension_filter
+                r for r in self._all_results if r.extension in self._extension_filter
             ]
         else:
             self._results = list(self._all_results)
+        self._reindex_rows()
         self._displayed_count = min(self._batch_size, len(self._results))
         self.endResetModel()
 
@@ -203,20 +224,20 @@ class ResultsModel(QAbstractListModel):
         self.beginResetModel()
         if self._extension_filter:
             self._results = [
-                r
-                for r in self._all_results
-                if r.path.suffix.lower() in self._extension_filter
+                r for r in self._all_results if r.extension in self._extension_filter
             ]
         else:
             self._results = list(self._all_results)
+        self._reindex_rows()
         self._displayed_count = min(self._batch_size, len(self._results))
         self.endResetModel()
 
     def sort_results(self, criteria: SortCriteria, query: str = "") -> None:
         """Sort results using the specified criteria.
 
-        AC3: Selection and scroll position should be preserved.
-        For now, we sort all results and reset display count.
+        AC3: Selection and scroll position should be preserved. Rows are
+        reordered in place as a layout change, so selected and current rows
+        follow their results and the revealed row count is kept.
 
         Args:
             criteria: SortCriteria enum value
@@ -229,11 +250,33 @@ class ResultsModel(QAbstractListModel):
         self._current_sort_criteria = criteria
         self._current_query = query
 
-        # Sort all results
-        sorted_results = SortEngine.sort(self._results, criteria, query)
+        # Sort the unfiltered master list so filtered-out results keep their
+        # place when the extension filter changes later
+        self._all_results = SortEngine.sort(self._all_results, criteria, query)
+        if self._extension_filter:
+            sorted_results = [
+                r for r in self._all_results if r.extension in self._extension_filter
+            ]
+        else:
+            sorted_results = list(self._all_results)
 
-        # Reset model with sorted results
-        self.set_results(sorted_results)
+        # Nothing to reorder: leave the view and its selection untouched
+        if len(sorted_results) == len(self._results) and all(
+            a is b for a, b in zip(sorted_results, self._results, strict=True)
+        ):
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        moved_results = [self._results[index.row()] for index in old_indexes]
+        self._results = sorted_results
+        self._reindex_rows()
+        # Rows sorted past the revealed count become invalid until fetched
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(self._row_by_id[id(r)]) for r in moved_results],
+        )
+        self.layoutChanged.emit()
 
     def get_current_sort_criteria(self) -> SortCriteria | None:
         """Get the currently applied sort criteria"""
@@ -1,14 +1,20 @@
 """Results view component for displaying search results."""
 
-from PyQt6.QtCore import QModelIndex, QPoint, Qt, pyqtSignal
-from PyQt6.QtGui import (
-    QCursor,
-    QKeyEvent,
-    QMouseEvent,
-    QStandardItem,
-    QStandardItemModel,
+from PyQt6.QtCore import (
+    QModelIndex,
+    QPoint,
+    QStringListModel,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QCursor, QKeyEvent, QMouseEvent, QResizeEvent
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QListView,
+    QStyleOptionViewItem,
+    QWidget,
 )
-from PyQt6.QtWidgets import QAbstractItemView, QListView, QWidget
 
 from filesearch.core.application_runtime import DesktopEffects
 from filesearch.core.sort_engine import SortCriteria
@@ -34,7 +40,7 @@ class ResultsView(QListView):
         self.desktop_effects = desktop_effects
 
         # Model - use ResultsModel for virtual scrolling
-        self._empty_model = QStandardItemModel()  # For empty states
+        self._empty_model = QStringListModel()  # For empty states
         self._results_model: ResultsModel | None = None
         self.setModel(self._empty_model)
 
@@ -52,15 +58,17 @@ class ResultsView(QListView):
         self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.setAlternatingRowColors(False)
-        self.setUniformItemSizes(True)  # Optimize for virtual scrolling
+        # Every row has the delegate's fixed size hint, so Qt can compute the
+        # scroll range and hit-tests without measuring each row
+        self.setUniformItemSizes(True)
+        # Lay out large models in chunks between event-loop iterations
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(256)
 
         # Enable smooth scrolling
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
 
-        # Enable virtual scrolling
-        self.setUniformItemSizes(True)
-
         # Keyboard navigation
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
@@ -76,8 +84,19 @@ class ResultsView(QListView):
         # Search state tracking
         self._is_searching = False
 
-        # Store reference to delegate for highlighting
+        # Typed reference to the delegate; use it instead of itemDelegate()
         self._delegate: ResultsItemDelegate = delegate
+        # Every row has the delegate's fixed height; used for page navigation
+        self._row_height = delegate.sizeHint(
+            QStyleOptionViewItem(), QModelIndex()
+        ).height()
+
+        # Highlight changes arrive in bursts (typing, applying settings);
+        # repaint once after the burst instead of once per change
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(50)
+        self._repaint_timer.timeout.connect(self._update_viewport)
 
     def _update_viewport(self) -> None:
         """Repaint the viewport when Qt has created it."""
@@ -94,43 +113,40 @@ class ResultsView(QListView):
 
     def set_query(self, query: str) -> None:
         """Set the current search query for highlighting"""
-        if self._delegate:
-            self._delegate.set_query(query)
+        self._delegate.set_query(query)
         # Trigger repaint to apply highlighting
-        self._update_viewport()
+        self._repaint_timer.start()
 
     def set_highlight_enabled(self, enabled: bool) -> None:
         """Enable or disable highlighting"""
-        if self._delegate:
-            self._delegate.set_highlight_enabled(enabled)
-        self._update_viewport()
+        self._delegate.set_highlight_enabled(enabled)
+        self._repaint_timer.start()
 
     def set_highlight_color(self, color: str) -> None:
         """Set the highlight color (HTML hex code like #FFFF99)"""
-        if self._delegate:
-            self._delegate.set_highlight_color(color)
-        self._update_viewport()
+        self._delegate.set_highlight_color(color)
+        self._repaint_timer.start()
 
     def set_highlight_style(self, style: str) -> None:
         """Set the highlight style ('background', 'outline', or 'underline')"""
-        if self._delegate:
-            self._delegate.set_highlight_style(style)
-        self._update_viewport()
+        self._delegate.set_highlight_style(style)
+        self._repaint_timer.start()
+
+    def set_highlight_case_sensitive(self, case_sensitive: bool) -> None:
+        """Set whether highlighting matches the query case-sensitively"""
+        self._delegate.set_highlight_case_sensitive(case_sensitive)
+        self._repaint_timer.start()
 
     def _show_empty_state(self, message: str) -> None:
         """Show empty state message"""
-        self._empty_model.clear()
-        item = QStandardItem(message)
-        item.setData(None, Qt.ItemDataRole.UserRole)  # No SearchResult
-        self._empty_model.appendRow(item)
+        # A plain string row; UserRole yields None, so no SearchResult
+        self._empty_model.setStringList([message])
 
     def set_results(self, results: list[SearchResult]) -> None:
         """Set search results to display"""
         if results:
             if not self._results_model:
-                self._results_model = ResultsModel()
-                # Connect error signal
-                self._results_model.error_occurred.connect(self._on_model_error)
+                self._results_model = self._create_results_model()
             self._results_model.set_results(results)
             self.setModel(self._results_model)
             # Auto-scroll to first result when search completes
@@ -143,6 +159,23 @@ class ResultsView(QListView):
             # Search is complete, enable double-click
             self.set_search_active(False)
 
+    def _create_results_model(self) -> ResultsModel:
+        """Create the results model, wired to this view"""
+        model = ResultsModel()
+        model.error_occurred.connect(self._on_model_error)
+        model.set_batch_size(self._model_batch_size())
+        return model
+
+    def _model_batch_size(self) -> int:
+        """Rows the model reveals per fetch: a few screens' worth, at least 100"""
+        return max(100, self._rows_per_page() * 4)
+
+    def resizeEvent(self, e: QResizeEvent | None) -> None:
+        """Scale the model's fetch batch with the visible height"""
+        super().resizeEvent(e)
+        if self._results_model:
+            self._results_model.set_batch_size(self._model_batch_size())
+
     def _on_model_error(self, message: str) -> None:
         """Handle errors from the model"""
         self.desktop_effects.show_error(self, "Error", message)
@@ -150,7 +183,6 @@ class ResultsView(QListView):
     def clear_results(self) -> None:
         """Clear all results"""
         self.setModel(self._empty_model)
-        self._empty_model.clear()
         self._show_empty_state("Enter a search term to begin")
         if self._results_model:
             self._results_model.clear()
@@ -162,7 +194,6 @@ class ResultsView(QListView):
         if self._results_model:
             self._results_model.clear()
         self.setModel(self._empty_model)
-        self._empty_model.clear()
         self._show_empty_state("Searching...")
         # Update search state
         self._is_searching = True
@@ -170,10 +201,13 @@ class ResultsView(QListView):
 
     def add_result(self, result: SearchResult) -> None:
         """Add a single result to the view"""
-        if not self._results_model or self.model() == self._empty_model:
+        self.add_results([result])
+
+    def add_results(self, results: list[SearchResult]) -> None:
+        """Add a batch of results to the view"""
+        if not self._results_model or self.model() is self._empty_model:
             if not self._results_model:
-                self._results_model = ResultsModel()
-                self._results_model.error_occurred.connect(self._on_model_error)
+                self._results_model = self._create_results_model()
             self.setModel(self._results_model)
             # Clear the searching state when first result arrives
             self.set_search_active(False)
@@ -182,7 +216,7 @@ class ResultsView(QListView):
         # Maintain scroll position when adding results
         scroll_bar = self.verticalScrollBar()
         vertical_scroll = scroll_bar.value() if scroll_bar else 0
-        self._results_model.add_result(result)
+        self._results_model.add_results(results)
         if scroll_bar:
             scroll_bar.setValue(vertical_scroll)
 
@@ -193,7 +227,7 @@ class ResultsView(QListView):
             return indexes[0].data(Qt.ItemDataRole.UserRole)
         return None
 
-    def apply_sorting(self, criteria: SortCriteria) -> None:
+    def apply_sorting(self, criteria: SortCriteria | None) -> None:
         """Apply sorting to current results
 
         AC6: Sort results using specified criteria
@@ -201,11 +235,15 @@ class ResultsView(QListView):
         Args:
             criteria: SortCriteria enum value
         """
-        if not self._results_model or not self._results_model.get_all_results():
+        if (
+            criteria is None
+            or not self._results_model
+            or not self._results_model.get_all_results()
+        ):
             return
 
         # Get current query from delegate for relevance sorting
-        query = getattr(self._delegate, "current_query", "") if self._delegate else ""
+        query = self._delegate.current_query or ""
 
         # Apply sorting
         self._results_model.sort_results(criteria, query)
@@ -216,6 +254,12 @@ class ResultsView(QListView):
             return self._results_model.get_current_sort_criteria()
         return None
 
+    def _rows_per_page(self) -> int:
+        """Return how many whole rows fit in the viewport (at least one)"""
+        viewport = self.viewport()
+        height = viewport.height() if viewport is not None else self.height()
+        return max(1, height // self._row_height)
+
     def keyPressEvent(self, e: QKeyEvent | None) -> None:  # noqa: C901 - maps supported key commands.
         """Handle keyboard navigation for results list"""
         if e is None:
@@ -302,14 +346,14 @@ class ResultsView(QListView):
                 self.setCurrentIndex(new_index)
         elif key == Qt.Key.Key_PageUp:
             # Move up by viewport height
-            visible_count = self.height() // self.sizeHint().height()
-            new_row = max(0, current_index.row() - visible_count)
+            new_row = max(0, current_index.row() - self._rows_per_page())
             new_index = model.index(new_row, 0)
             self.setCurrentIndex(new_index)
         elif key == Qt.Key.Key_PageDown:
             # Move down by viewport height
-            visible_count = self.height() // self.sizeHint().height()
-            new_row = min(model.rowCount() - 1, current_index.row() + visible_count)
+            new_row = min(
+                model.rowCount() - 1, current_index.row() + self._rows_per_page()
+            )
             new_index = model.index(new_row, 0)
             self.setCurrentIndex(new_index)
         elif key == Qt.Key.Key_Return or key == Qt.Key.Key_Enter:
@@ -343,7 +387,7 @@ class ResultsView(QListView):
             # Folder rows: whole row navigates into the folder (browse)
             if result is not None and getattr(result, "path", None) is not None:
                 try:
-                    is_directory = result.path.is_dir()
+                    is_directory = result.is_directory
                 except OSError:
                     is_directory = False
                 if is_directory:
@@ -397,8 +441,6 @@ class ResultsView(QListView):
         self.setCurrentIndex(index)
         self._update_viewport()
 
-        from PyQt6.QtCore import QTimer
-
         QTimer.singleShot(150, lambda: self._restore_selection(original_selection))
 
     def _restore_selection(self, original_selection: list[QModelIndex]) -> None:
@@ -0,0 +1,67 @@
+"""Debounced configuration file writes for the search controls."""
+
+from loguru import logger
+from PyQt6.QtCore import QCoreApplication, QObject, QTimer
+
+from filesearch.core.config_manager import ConfigManager
+
+
+class DebouncedConfigSave(QObject):
+    """Coalesce configuration file writes requested by a widget.
+
+    The widget updates the in-memory configuration itself and calls
+    ``schedule()``; the file is written once ``delay_ms`` passes without a
+    further request, and a pending write is flushed when the app quits.
+    """
+
+    def __init__(
+        self,
+        config_manager: ConfigManager | None,
+        description: str,
+        delay_ms: int,
+        parent: QObject | None = None,
+    ) -> None:
+        """Initialize the debounced save.
+
+        Args:
+            config_manager: Configuration to write, or None to skip writes
+            description: What the write persists, used in log messages
+            delay_ms: Quiet period before the file is written
+            parent: Owning widget
+        """
+        super().__init__(parent)
+        self._config_manager = config_manager
+        self._description = description
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._write)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+
+    def schedule(self) -> None:
+        """Request a write, restarting the quiet period."""
+        if self._config_manager is not None:
+            self._timer.start()
+
+    def is_pending(self) -> bool:
+        """Return True while a requested write has not happened yet."""
+        return self._timer.isActive()
+
+    def flush(self) -> None:
+        """Write a pending save now (e.g. when the app quits)."""
+        if self._timer.isActive():
+            self._timer.stop()
+            self._write()
+
+    def _write(self) -> None:
+        """Write the configuration to disk."""
+        if self._config_manager is None:
+            return
+
+        try:
+            self._config_manager.save()
+            logger.debug(f"Saved {self._description}")
+        except Exception as e:
+            logger.error(f"Error saving {self._description}: {e}")
@@ -1,11 +1,18 @@
 """Directory selector widget for choosing search directories."""
 
+import contextlib
 from pathlib import Path
-from typing import cast
 
 from loguru import logger
-from PyQt6.QtCore import QEvent, QObject, QPoint, QSize, Qt, pyqtSignal
-from PyQt6.QtGui import QDragEnterEvent, QKeyEvent, QKeySequence, QShortcut
+from PyQt6.QtCore import (
+    QPoint,
+    QSize,
+    QStringListModel,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QAction, QDragEnterEvent, QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
     QCompleter,
     QHBoxLayout,
@@ -21,6 +28,7 @@ from PyQt6.QtWidgets import (
 from filesearch.core.application_runtime import DesktopEffects
 from filesearch.core.config_manager import ConfigManager
 from filesearch.core.file_utils import normalize_path, validate_directory
+from filesearch.ui.search_controls.config_save import DebouncedConfigSave
 
 
 class DirectorySelectorWidget(QWidget):
@@ -36,6 +44,9 @@ class DirectorySelectorWidget(QWidget):
     browse_clicked = pyqtSignal()
     enter_pressed = pyqtSignal()
 
+    RECENT_SAVE_DELAY_MS = 500
+    VALIDATION_DELAY_MS = 250
+
     def __init__(
         self,
         config_manager: ConfigManager,
@@ -47,11 +58,32 @@ class DirectorySelectorWidget(QWidget):
         self.config_manager = config_manager
         self.desktop_effects = desktop_effects
         self.recent_directories: list[str] = []
+        # Recent directories menu, built on first use and kept
+        self._menu: QMenu | None = None
+        self._menu_entries: tuple[str, ...] | None = None
+        # AC 2.3: Common paths (home, documents, desktop) offered by the
+        # auto-completer; the home directory is fixed for the widget's lifetime
+        home = self.config_manager.home_dir
+        self._common_paths = [
+            str(home),
+            str(home / "Documents"),
+            str(home / "Desktop"),
+        ]
+        # Debounce timer for writing recent directories to disk
+        self._config_save = DebouncedConfigSave(
+            config_manager, "recent directories", self.RECENT_SAVE_DELAY_MS, self
+        )
+        # Debounce timer for validating typed paths; each validation stats
+        # the filesystem and announces the directory to listeners
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(self.VALIDATION_DELAY_MS)
+        self._validate_timer.timeout.connect(self._validate_input)
         self._setup_ui()
         self._setup_style()
         self._load_recent_directories()
         self._set_default_directory()
-        self._setup_completer()
+        self._refresh_completer()
 
     def _setup_ui(self) -> None:
         """Setup user interface components."""
@@ -80,6 +112,15 @@ class DirectorySelectorWidget(QWidget):
         self.directory_input.setMinimumHeight(36)
         h_layout.addWidget(self.directory_input)
 
+        # Auto-completer; its model is refreshed in place as recent
+        # directories change
+        self._completer_model = QStringListModel(self)
+        self._completer = QCompleter(self._completer_model, self)
+        self._completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        self._completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self.directory_input.setCompleter(self._completer)
+
         # Dropdown button for recent directories
         self.recent_button = QToolButton()
         self.recent_button.setText("\u25bc")
@@ -100,7 +141,10 @@ class DirectorySelectorWidget(QWidget):
         # Connect signals
         self.browse_button.clicked.connect(self._on_browse_clicked)
         self.recent_button.clicked.connect(self._show_recent_menu)
-        self.directory_input.textChanged.connect(self._on_text_changed)
+        # Only user edits (typing or picking a completion) are validated
+        # here; programmatic setText callers validate immediately themselves
+        self.directory_input.textEdited.connect(self._on_text_changed)
+        self._completer.activated.connect(self._on_text_changed)
         self.directory_input.setDragEnabled(True)
         self.directory_input.setAcceptDrops(True)
         self.directory_input.dragEnterEvent = self.dragEnterEvent  # type: ignore[method-assign,assignment]  # Qt forwards line-edit drag events to the containing selector.
@@ -110,8 +154,8 @@ class DirectorySelectorWidget(QWidget):
         )
         self.directory_input.customContextMenuRequested.connect(self._show_context_menu)
 
-        # Install event filter for Enter key detection
-        self.directory_input.installEventFilter(self)
+        # Enter in the directory input starts a search
+        self.directory_input.returnPressed.connect(self._on_return_pressed)
 
         # Keyboard shortcuts
         self.shortcut_browse = QShortcut(QKeySequence("Ctrl+O"), self)
@@ -119,58 +163,57 @@ class DirectorySelectorWidget(QWidget):
         self.shortcut_focus = QShortcut(QKeySequence("Ctrl+D"), self)
         self.shortcut_focus.activated.connect(lambda: self.directory_input.setFocus())
 
-    def _show_recent_menu(self) -> None:
-        """Create and show the context menu for recent directories."""
-        menu = QMenu(self)
+    def _recent_menu(self) -> QMenu:
+        """Return the recent directories menu, repopulated only when stale.
 
-        if not self.recent_directories:
+        The recent button and the input's context menu share one menu; it is
+        rebuilt when ``recent_directories`` differs from the entries it shows.
+        """
+        if self._menu is None:
+            self._menu = QMenu(self)
+            self._menu.triggered.connect(self._on_recent_action_triggered)
+
+        entries = tuple(self.recent_directories)
+        if entries == self._menu_entries:
+            return self._menu
+        self._menu_entries = entries
+
+        menu = self._menu
+        menu.clear()
+        if not entries:
             action = menu.addAction("No recent directories")
             if action is not None:
                 action.setEnabled(False)
         else:
-            for directory in self.recent_directories:
+            for directory in entries:
                 # AC: Display friendly names: /home/user/Documents -> "Documents"
                 path_obj = Path(directory)
                 friendly_name = path_obj.name if path_obj.name else str(path_obj)
                 action = menu.addAction(f"{friendly_name} ({directory})")
                 if action is not None:
                     action.setData(directory)
-                    action.triggered.connect(
-                        lambda checked, d=directory: self.set_directory(Path(d))
-                    )
 
             menu.addSeparator()
             clear_action = menu.addAction("Clear History")
             if clear_action is not None:
                 clear_action.triggered.connect(self._clear_recent_history)
+        return menu
+
+    def _on_recent_action_triggered(self, action: QAction) -> None:
+        """Switch to the directory carried by a recent-menu action."""
+        directory = action.data()
+        if directory:
+            self.set_directory(Path(directory))
 
-        # Show the menu below the button
-        menu.exec(
+    def _show_recent_menu(self) -> None:
+        """Show the recent directories menu below the recent button."""
+        self._recent_menu().exec(
             self.recent_button.mapToGlobal(self.recent_button.rect().bottomLeft())
         )
 
     def _show_context_menu(self, pos: QPoint) -> None:
-        """Show context menu for recent directories on right-click."""
-        menu = QMenu(self)
-        if self.recent_directories:
-            for directory in self.recent_directories:
-                path_obj = Path(directory)
-                friendly_name = path_obj.name if path_obj.name else str(path_obj)
-                action = menu.addAction(f"{friendly_name} ({directory})")
-                if action is not None:
-                    action.setData(directory)
-                    action.triggered.connect(
-                        lambda checked, d=directory: self.set_directory(Path(d))
-                    )
-            menu.addSeparator()
-            clear_action = menu.addAction("Clear History")
-            if clear_action is not None:
-                clear_action.triggered.connect(self._clear_recent_history)
-        else:
-            action = menu.addAction("No recent directories")
-            if action is not None:
-                action.setEnabled(False)
-        menu.exec(self.directory_input.mapToGlobal(pos))
+        """Show the recent directories menu on right-click."""
+        self._recent_menu().exec(self.directory_input.mapToGlobal(pos))
 
     def _clear_recent_history(self) -> None:
         """Clear the recent directories list and save."""
@@ -213,40 +256,24 @@ class DirectorySelectorWidget(QWidget):
             logger.error(f"Error loading recent directories: {e}")
             self.recent_directories = []
 
-    def _setup_completer(self) -> None:
-        """Setup auto-completer with common paths and recent directories."""
-        # AC 2.3: Auto-complete common paths (home, documents, desktop)
-        home = str(self.config_manager.home_dir)
-        common_paths = [
-            home,
-            str(Path(home) / "Documents"),
-            str(Path(home) / "Desktop"),
-        ]
-
-        # Include recent directories in addition
-        all_options = common_paths + self.recent_directories
-
-        if not all_options:
-            return
-
-        completer = QCompleter(all_options)
-        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        completer.setFilterMode(Qt.MatchFlag.MatchContains)
-        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-
-        self.directory_input.setCompleter(completer)
-
-        logger.debug("Directory auto-completer setup completed")
+    def _refresh_completer(self) -> None:
+        """Show common paths and recent directories in the auto-completer."""
+        self._completer_model.setStringList(
+            self._common_paths + self.recent_directories
+        )
 
     def _save_recent_directories(self) -> None:
-        """Save recent directories to configuration."""
+        """Save recent directories to configuration.
+
+        The in-memory configuration updates immediately; the file write is
+        debounced by ``RECENT_SAVE_DELAY_MS``.
+        """
         if not self.config_manager:
             return
 
         try:
             self.config_manager.set("recent.directories", self.recent_directories)
-            self.config_manager.save()
-            logger.debug("Recent directories saved")
+            self._config_save.schedule()
         except Exception as e:
             logger.error(f"Error saving recent directories: {e}")
 
@@ -260,32 +287,50 @@ class DirectorySelectorWidget(QWidget):
         if not dir_str or not directory.is_dir():
             return
 
-        # Remove if already exists
-        if dir_str in self.recent_directories:
+        # Move to the front, dropping any earlier occurrence
+        with contextlib.suppress(ValueError):
             self.recent_directories.remove(dir_str)
-
-        # Add to beginning
         self.recent_directories.insert(0, dir_str)
 
-        # Trim to maximum size (max 5 entries)
-        self.recent_directories = self.recent_directories[:5]
+        # Trim to maximum size (max 5 entries) in place
+        del self.recent_directories[5:]
 
         self._save_recent_directories()
-        self._setup_completer()
+        self._refresh_completer()
         logger.debug(f"Added to recent directories: '{dir_str}'")
 
     def _set_default_directory(self) -> None:
         """Set the default directory to the user's home directory."""
         home_dir_path = self.config_manager.home_dir.resolve()
         self.directory_input.setText(str(home_dir_path))
-        self.directory_changed.emit(home_dir_path)
+        self._validate_input()
 
     def _on_text_changed(self, text: str) -> None:
-        """Handle text change events, normalize, validate, and emit signal."""
+        """Handle text change events; validation waits for typing to pause."""
+        if not text.strip():
+            # Clearing the path takes effect immediately
+            self._validate_input()
+            return
+
+        self._validate_timer.start()
+
+    def _on_return_pressed(self) -> None:
+        """Announce a typed path before asking for a search."""
+        self.flush_pending_validation()
+        self.enter_pressed.emit()
+
+    def flush_pending_validation(self) -> None:
+        """Validate typed input now if its debounced validation is pending."""
+        if self._validate_timer.isActive():
+            self._validate_input()
+
+    def _validate_input(self) -> None:
+        """Normalize and validate the current input text and emit the result."""
+        self._validate_timer.stop()
+        text = self.directory_input.text()
         if not text.strip():
             self.directory_input.setToolTip("")
-            self.directory_input.setProperty("state", "normal")
-            self._refresh_input_style()
+            self._set_input_state("normal")
             self.directory_changed.emit(Path(""))
             return
 
@@ -299,27 +344,29 @@ class DirectorySelectorWidget(QWidget):
             if error_message:
                 # Show error state for invalid paths (red border, tooltip)
                 self.directory_input.setToolTip(error_message)
-                self.directory_input.setProperty("state", "error")
-                self._refresh_input_style()
+                self._set_input_state("error")
                 self.directory_changed.emit(
                     normalized_path
                 )  # Emit even on error to allow search engine to handle it
             else:
                 # Valid path
                 self.directory_input.setToolTip(str(normalized_path))
-                self.directory_input.setProperty("state", "normal")
-                self._refresh_input_style()
+                self._set_input_state("normal")
                 self.directory_changed.emit(normalized_path)
 
         except Exception as e:
             logger.error(f"Error during path validation: {e}")
             self.directory_input.setToolTip(f"Internal error: {e}")
-            self.directory_input.setProperty("state", "error")
-            self._refresh_input_style()
+            self._set_input_state("error")
             self.directory_changed.emit(Path(text))
 
-    def _refresh_input_style(self) -> None:
-        """Reapply the input's theme after its state property changes."""
+    def _set_input_state(self, state: str) -> None:
+        """Set the input's theme state, re-polishing only when it changes."""
+        if self.directory_input.property("state") == state:
+            return
+        self.directory_input.setProperty("state", state)
+
+        # Reapply the input's theme for the new state
         style = self.directory_input.style()
         if style is not None:
             style.unpolish(self.directory_input)
@@ -332,7 +379,7 @@ class DirectorySelectorWidget(QWidget):
     def set_directory(self, path: Path) -> None:
         """Set the directory input text from a Path object."""
         self.directory_input.setText(str(path))
-        self.directory_changed.emit(path)
+        self._validate_input()
 
     def remember_directory(self, path: Path) -> None:
         """Add a directory to recent history without changing the current input."""
@@ -357,14 +404,3 @@ class DirectorySelectorWidget(QWidget):
             path = Path(urls[0].toLocalFile())
             if path.is_dir():
                 event.acceptProposedAction()
-
-    def eventFilter(self, obj: QObject | None, event: QEvent) -> bool:  # type: ignore[override]  # Qt supplies a concrete event.
-        """Event filter to detect Enter key in directory input."""
-        if (
-            obj == self.directory_input
-            and event.type() == QEvent.Type.KeyPress
-            and cast(QKeyEvent, event).key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter)
-        ):
-            self.enter_pressed.emit()
-            return True  # Consume the event
-        return super().eventFilter(obj, event)
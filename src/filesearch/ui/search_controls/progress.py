@@ -3,7 +3,8 @@
 import time
 
 from loguru import logger
-from PyQt6.QtCore import QSize, QTimer, pyqtSignal
+from PyQt6.QtCore import QRect, QSize, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QPainter, QPalette, QPixmap
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -26,6 +27,12 @@ class ProgressWidget(QWidget):
     # Signals
     progress_updated = pyqtSignal(int, str)  # files_scanned, current_dir
 
+    # Minimum interval between progress repaints (~15 updates/s)
+    PROGRESS_UPDATE_INTERVAL_MS = 66
+
+    # Spinner animation frames
+    _SPINNER_GLYPHS = ("\u27f3", "\u27f2", "\u27f1", "\u27f0")
+
     def __init__(self, parent: QWidget | None = None):
         """Initialize progress widget.
 
@@ -44,9 +51,18 @@ class ProgressWidget(QWidget):
 
         # Animation state
         self.spinner_angle = 0
-        self.animation_timer = QTimer()
+        self._spinner_pixmaps: list[QPixmap] | None = None
+        self.animation_timer = QTimer(self)
         self.animation_timer.timeout.connect(self._animate_spinner)
 
+        # Throttle for progress repaints; updates arriving while it runs are
+        # coalesced and the latest one is drawn when it fires
+        self._progress_throttle_timer = QTimer(self)
+        self._progress_throttle_timer.setSingleShot(True)
+        self._progress_throttle_timer.setInterval(self.PROGRESS_UPDATE_INTERVAL_MS)
+        self._progress_throttle_timer.timeout.connect(self._flush_pending_progress)
+        self._progress_pending = False
+
         # Setup UI
         self._setup_ui()
         self._setup_style()
@@ -100,11 +116,38 @@ class ProgressWidget(QWidget):
         """Setup widget styling via centralized theme."""
         self.setObjectName("progressWidget")
 
+    def _spinner_frames(self) -> list[QPixmap]:
+        """Return the spinner glyphs pre-rendered in the label's themed style.
+
+        Rendered on first use, once the theme's font and colour have been
+        applied to the label, so each animation tick only swaps a pixmap.
+        """
+        if self._spinner_pixmaps is None:
+            label = self.spinner_label
+            ratio = label.devicePixelRatioF()
+            rect = QRect(0, 0, label.width(), label.height())
+            color = label.palette().color(QPalette.ColorRole.WindowText)
+            frames = []
+            for glyph in self._SPINNER_GLYPHS:
+                pixmap = QPixmap(
+                    round(rect.width() * ratio), round(rect.height() * ratio)
+                )
+                pixmap.setDevicePixelRatio(ratio)
+                pixmap.fill(Qt.GlobalColor.transparent)
+                painter = QPainter(pixmap)
+                painter.setFont(label.font())
+                painter.setPen(color)
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, glyph)
+                painter.end()
+                frames.append(pixmap)
+            self._spinner_pixmaps = frames
+        return self._spinner_pixmaps
+
     def _animate_spinner(self) -> None:
-        """Animate the spinner by rotating through characters."""
-        spinner_chars = ["\u27f3", "\u27f2", "\u27f1", "\u27f0"]
-        self.spinner_angle = (self.spinner_angle + 1) % len(spinner_chars)
-        self.spinner_label.setText(spinner_chars[self.spinner_angle])
+        """Animate the spinner by rotating through pre-rendered frames."""
+        frames = self._spinner_frames()
+        self.spinner_angle = (self.spinner_angle + 1) % len(frames)
+        self.spinner_label.setPixmap(frames[self.spinner_angle])
 
     def _format_file_count(self, count: int) -> str:
         """Format file count with thousands separator.
@@ -169,6 +212,10 @@ class ProgressWidget(QWidget):
     def update_progress(self, files_scanned: int, current_dir: str) -> None:
         """Update progress display.
 
+        The first update is drawn immediately; further updates within
+        ``PROGRESS_UPDATE_INTERVAL_MS`` are coalesced and the latest one is
+        drawn when the interval ends.
+
         Args:
             files_scanned: Number of files scanned so far
             current_dir: Current directory being scanned
@@ -176,18 +223,44 @@ class ProgressWidget(QWidget):
         self.files_scanned = files_scanned
         self.current_dir = current_dir
 
+        if self._progress_throttle_timer.isActive():
+            self._progress_pending = True
+            return
+
+        self._progress_pending = False
+        self._progress_throttle_timer.start()
+        self._render_progress(files_scanned, current_dir)
+
+    def _flush_pending_progress(self) -> None:
+        """Draw the latest coalesced progress update, if one is waiting."""
+        if self._progress_pending:
+            self.update_progress(self.files_scanned, self.current_dir)
+
+    def _cancel_pending_progress(self) -> None:
+        """Drop a coalesced progress update that has not been drawn yet."""
+        self._progress_throttle_timer.stop()
+        self._progress_pending = False
+
+    def _render_progress(self, files_scanned: int, current_dir: str) -> None:
+        """Draw a progress update.
+
+        Args:
+            files_scanned: Number of files scanned so far
+            current_dir: Current directory being scanned
+        """
         # Update file counter
         self.file_counter.setText(self._format_file_count(files_scanned))
 
         # Update progress text
         truncated_dir = self._truncate_path(current_dir)
-        remaining_time = self._estimate_remaining_time(files_scanned)
 
         if self.is_determinate and self.total_files_estimate > 0:
             percentage = min(
                 100, int((files_scanned / self.total_files_estimate) * 100)
             )
             self.progress_bar.setValue(percentage)
+            # Only determinate progress shows an estimate
+            remaining_time = self._estimate_remaining_time(files_scanned)
             time_str = f" | {remaining_time}" if remaining_time else ""
             self.progress_text.setText(
                 f"Scanning {truncated_dir}... ({percentage}%){time_str}"
@@ -208,15 +281,26 @@ class ProgressWidget(QWidget):
         """
         self.is_determinate = True
         self.total_files_estimate = total_files
-        self.progress_bar.setRange(0, 100)
+        self._set_bar_range(0, 100)
         self.progress_bar.setValue(0)
         logger.debug(f"Set determinate mode with {total_files} total files")
 
+    def _set_bar_range(self, minimum: int, maximum: int) -> None:
+        """Set the progress bar range, skipping the relayout if it is unchanged.
+
+        Args:
+            minimum: Range minimum
+            maximum: Range maximum (0 with minimum 0 means indeterminate)
+        """
+        bar = self.progress_bar
+        if bar.minimum() != minimum or bar.maximum() != maximum:
+            bar.setRange(minimum, maximum)
+
     def set_indeterminate_mode(self) -> None:
         """Set progress bar to indeterminate mode."""
         self.is_determinate = False
         self.total_files_estimate = 0
-        self.progress_bar.setRange(0, 0)  # Indeterminate
+        self._set_bar_range(0, 0)  # Indeterminate
         logger.debug("Set indeterminate mode")
 
     def show_progress(self) -> None:
@@ -233,6 +317,7 @@ class ProgressWidget(QWidget):
         if self.is_visible:
             self.is_visible = False
             self.animation_timer.stop()
+            self._cancel_pending_progress()
             self.setVisible(False)
             # Reset state
             self.files_scanned = 0
@@ -247,6 +332,7 @@ class ProgressWidget(QWidget):
         Args:
             error_message: Error message to display
         """
+        self._cancel_pending_progress()
         self.progress_text.setText(f"Error: {error_message}")
         self.spinner_label.setText("\u274c")
         self.animation_timer.stop()
@@ -270,6 +356,7 @@ class ProgressWidget(QWidget):
         Args:
             total_files: Total number of files scanned
         """
+        self._cancel_pending_progress()
         self.progress_text.setText("Search completed")
         self.file_counter.setText(self._format_file_count(total_files))
         self.spinner_label.setText("\u2705")
@@ -38,6 +38,8 @@ class SearchControlWidget(QWidget):
         # State
         self._state = SearchState.IDLE
         self._query_empty = True
+        # Last "state" property the button was polished for
+        self._polished_state: str | None = None
 
         # Setup UI
         self._setup_ui()
@@ -136,6 +138,13 @@ class SearchControlWidget(QWidget):
             self.search_button.setProperty("state", "search")
             self.search_button.setEnabled(self._can_start_search())
 
+        # Re-polish only when the stylesheet's state selector changed;
+        # setText/setEnabled are no-ops for unchanged values
+        style_state = self.search_button.property("state")
+        if style_state == self._polished_state:
+            return
+        self._polished_state = style_state
+
         # Apply style changes
         style = self.search_button.style()
         if style:
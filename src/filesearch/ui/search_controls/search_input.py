@@ -1,19 +1,21 @@
 """Search input widget with history, auto-complete, and visual feedback."""
 
+import contextlib
+
 from loguru import logger
-from PyQt6.QtCore import QSize, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QFocusEvent, QKeyEvent
+from PyQt6.QtCore import QSize, QStringListModel, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QAction, QFocusEvent, QIcon, QKeyEvent
 from PyQt6.QtWidgets import (
     QCompleter,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QToolButton,
     QVBoxLayout,
     QWidget,
 )
 
 from filesearch.core.config_manager import ConfigManager
+from filesearch.ui.search_controls.config_save import DebouncedConfigSave
 
 
 class SearchInputWidget(QWidget):
@@ -43,6 +45,7 @@ class SearchInputWidget(QWidget):
     MAX_SEARCH_LENGTH = 255
     SEARCH_HISTORY_SIZE = 10
     DEFAULT_AUTO_SEARCH_DELAY_MS = 500
+    HISTORY_SAVE_DELAY_MS = 500
 
     def __init__(
         self,
@@ -67,10 +70,21 @@ class SearchInputWidget(QWidget):
         self.auto_search_enabled = True
         self.auto_search_delay_ms = self.DEFAULT_AUTO_SEARCH_DELAY_MS
 
-        # Debounce timer for auto-search
-        self._debounce_timer = QTimer()
+        # Debounce timer for auto-search; owned by the widget so Qt stops it
+        # with the widget
+        self._debounce_timer = QTimer(self)
         self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self._debounce_timer.timeout.connect(self._on_debounce_timeout)
+        # True while set_text/clear_text update the field, so programmatic
+        # edits do not schedule an auto-search
+        self._setting_text = False
+
+        # Debounce timer for writing search history to disk; a burst of
+        # searches produces one config file write
+        self._config_save = DebouncedConfigSave(
+            config_manager, "search history", self.HISTORY_SAVE_DELAY_MS, self
+        )
 
         # Setup UI
         self._setup_ui()
@@ -91,8 +105,9 @@ class SearchInputWidget(QWidget):
     def _setup_ui(self) -> None:
         """Setup user interface components as a unified search bar.
 
-        Layout: [search-icon] [QLineEdit] [clear-btn] [loading-indicator]
-        All wrapped in a single styled container.
+        Layout: [search-icon] [QLineEdit [clear] [loading]]
+        All wrapped in a single styled container; the clear and loading
+        icons are line-edit actions drawn inside the input.
         """
         # Main layout — no extra margins, the container IS the widget
         layout = QVBoxLayout()
@@ -145,33 +160,42 @@ class SearchInputWidget(QWidget):
         self.search_input.setAlignment(Qt.AlignmentFlag.AlignVCenter)
         search_layout.addWidget(self.search_input, 1)
 
-        # Clear button
+        # Auto-completer over the search history; history changes only
+        # replace the model's strings
+        self._history_model = QStringListModel(self)
+        self._completer = QCompleter(self._history_model, self)
+        self._completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        self._completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self.search_input.setCompleter(self._completer)
+
+        # Clear and loading actions, drawn by the line edit itself at its
+        # trailing edge
         try:
             import qtawesome as qta
 
             from filesearch.ui.theme import Colors as _C
 
-            self.clear_button = QToolButton()
-            self.clear_button.setIcon(qta.icon("mdi6.close", color=_C.TEXT_TERTIARY))
+            clear_icon: QIcon = qta.icon("mdi6.close", color=_C.TEXT_TERTIARY)
+            loading_icon: QIcon = qta.icon("mdi6.loading", color=_C.PRIMARY)
         except Exception:
-            self.clear_button = QToolButton()
-            self.clear_button.setText("\u2715")
-        self.clear_button.setProperty("class", "clear-button")
+            clear_icon = QIcon.fromTheme("edit-clear")
+            loading_icon = QIcon.fromTheme("view-refresh")
+        # The action text doubles as the accessible name of its button
+        self.clear_button = QAction(clear_icon, "Clear search", self.search_input)
         self.clear_button.setToolTip("Clear search")
-        self.clear_button.setAccessibleName("Clear search")
-        self.clear_button.setAccessibleDescription("Clear search")
-        self.clear_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.clear_button.setVisible(False)
-        self.clear_button.clicked.connect(self.clear_text)
-        self.clear_button.setFixedSize(24, 24)
-        search_layout.addWidget(self.clear_button)
+        self.clear_button.triggered.connect(self.clear_text)
+        self.search_input.addAction(
+            self.clear_button, QLineEdit.ActionPosition.TrailingPosition
+        )
 
-        # Loading indicator
-        self.loading_indicator = QLabel("\u27f3")
-        self.loading_indicator.setProperty("class", "loading-indicator")
+        self.loading_indicator = QAction(loading_icon, "Searching", self.search_input)
+        self.loading_indicator.setToolTip("Searching")
         self.loading_indicator.setVisible(False)
-        self.loading_indicator.setFixedSize(24, 24)
-        search_layout.addWidget(self.loading_indicator)
+        self.search_input.addAction(
+            self.loading_indicator, QLineEdit.ActionPosition.TrailingPosition
+        )
 
         layout.addWidget(search_container)
 
@@ -194,8 +218,8 @@ class SearchInputWidget(QWidget):
             # Ensure we don't exceed the maximum
             self.search_history = self.search_history[: self.SEARCH_HISTORY_SIZE]
 
-            # Setup completer with search history
-            self._setup_completer()
+            # Offer the loaded history as completions
+            self._refresh_completer()
 
             logger.debug(f"Loaded {len(self.search_history)} search history items")
 
@@ -203,19 +227,9 @@ class SearchInputWidget(QWidget):
             logger.error(f"Error loading search history: {e}")
             self.search_history = []
 
-    def _setup_completer(self) -> None:
-        """Setup auto-completer with search history."""
-        if not self.search_history:
-            return
-
-        completer = QCompleter(self.search_history)
-        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        completer.setFilterMode(Qt.MatchFlag.MatchContains)
-        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-
-        self.search_input.setCompleter(completer)
-
-        logger.debug("Auto-completer setup completed")
+    def _refresh_completer(self) -> None:
+        """Show the current search history in the auto-completer."""
+        self._history_model.setStringList(self.search_history)
 
     def _load_auto_search_config(self) -> None:
         """Load auto-search configuration."""
@@ -239,15 +253,17 @@ class SearchInputWidget(QWidget):
             self.auto_search_delay_ms = self.DEFAULT_AUTO_SEARCH_DELAY_MS
 
     def _save_search_history(self) -> None:
-        """Save search history to configuration."""
+        """Save search history to configuration.
+
+        The in-memory configuration updates immediately; the file write is
+        debounced by ``HISTORY_SAVE_DELAY_MS``.
+        """
         if not self.config_manager:
             return
 
         try:
             self.config_manager.set("recent.searches", self.search_history)
-            self.config_manager.save()
-            logger.debug("Search history saved")
-
+            self._config_save.schedule()
         except Exception as e:
             logger.error(f"Error saving search history: {e}")
 
@@ -262,18 +278,16 @@ class SearchInputWidget(QWidget):
 
         query = query.strip()
 
-        # Remove if already exists
-        if query in self.search_history:
+        # Move to the front, dropping any earlier occurrence
+        with contextlib.suppress(ValueError):
             self.search_history.remove(query)
-
-        # Add to beginning
         self.search_history.insert(0, query)
 
-        # Trim to maximum size
-        self.search_history = self.search_history[: self.SEARCH_HISTORY_SIZE]
+        # Trim to maximum size in place
+        del self.search_history[self.SEARCH_HISTORY_SIZE :]
 
         # Update completer
-        self._setup_completer()
+        self._refresh_completer()
 
         # Save to configuration
         self._save_search_history()
@@ -290,16 +304,7 @@ class SearchInputWidget(QWidget):
         self.loading_indicator.setVisible(is_loading)
 
         # Update style based on state
-        if is_loading:
-            self.search_input.setProperty("state", "loading")
-        else:
-            self.search_input.setProperty("state", "normal")
-
-        # Apply style changes
-        style = self.search_input.style()
-        if style:
-            style.unpolish(self.search_input)
-            style.polish(self.search_input)
+        self._set_input_state("loading" if is_loading else "normal")
 
         logger.debug(f"Loading state set to: {is_loading}")
 
@@ -312,10 +317,19 @@ class SearchInputWidget(QWidget):
         self.has_error = has_error
 
         # Update style based on state
-        if has_error:
-            self.search_input.setProperty("state", "error")
-        else:
-            self.search_input.setProperty("state", "normal")
+        self._set_input_state("error" if has_error else "normal")
+
+        logger.debug(f"Error state set to: {has_error}")
+
+    def _set_input_state(self, state: str) -> None:
+        """Set the input's theme state, re-polishing only when it changes.
+
+        Args:
+            state: Value for the ``state`` property used by the stylesheet
+        """
+        if self.search_input.property("state") == state:
+            return
+        self.search_input.setProperty("state", state)
 
         # Apply style changes
         style = self.search_input.style()
@@ -323,14 +337,13 @@ class SearchInputWidget(QWidget):
             style.unpolish(self.search_input)
             style.polish(self.search_input)
 
-        logger.debug(f"Error state set to: {has_error}")
-
     def clear_text(self) -> None:
-        """Clear search input text."""
-        self.search_input.clear()
-        self.clear_button.setVisible(False)
-        self.text_changed.emit("")
-        self.query_empty_changed.emit(True)
+        """Clear search input text; ``_on_text_changed`` notifies listeners."""
+        self._setting_text = True
+        try:
+            self.search_input.clear()
+        finally:
+            self._setting_text = False
         logger.debug("Search input cleared")
 
     def get_text(self) -> str:
@@ -347,10 +360,11 @@ class SearchInputWidget(QWidget):
         Args:
             text: Text to set in the search input
         """
-        self.search_input.setText(text)
-        self._update_clear_button_visibility()
-        self.text_changed.emit(text)
-        self.query_empty_changed.emit(not bool(text.strip()))
+        self._setting_text = True
+        try:
+            self.search_input.setText(text)
+        finally:
+            self._setting_text = False
 
     def set_focus(self) -> None:
         """Set focus to the search input."""
@@ -358,9 +372,12 @@ class SearchInputWidget(QWidget):
         self.search_input.selectAll()
         logger.debug("Focus set to search input")
 
-    def _update_clear_button_visibility(self) -> None:
-        """Update clear button visibility based on text content."""
-        has_text = bool(self.search_input.text().strip())
+    def _update_clear_button_visibility(self, has_text: bool) -> None:
+        """Update clear button visibility based on text content.
+
+        Args:
+            has_text: Whether the input holds non-whitespace text
+        """
         self.clear_button.setVisible(has_text and not self.is_loading)
 
     def _on_debounce_timeout(self) -> None:
@@ -397,7 +414,7 @@ class SearchInputWidget(QWidget):
 
         elif (
             event.key() == Qt.Key.Key_L
-            and event.modifiers() == Qt.KeyboardModifier.ControlModifier
+            and event.modifiers() & Qt.KeyboardModifier.ControlModifier
         ):
             # Ctrl+L selects all text
             self.search_input.selectAll()
@@ -423,7 +440,6 @@ class SearchInputWidget(QWidget):
         """
         super().focusInEvent(a0)
         self.focus_gained.emit()
-        logger.debug("Search input gained focus")
 
     def focusOutEvent(self, a0: QFocusEvent) -> None:  # type: ignore[override]  # Qt supplies a concrete focus event.
         """Handle focus out event.
@@ -433,16 +449,14 @@ class SearchInputWidget(QWidget):
         """
         super().focusOutEvent(a0)
         self.focus_lost.emit()
-        logger.debug("Search input lost focus")
 
     def connect_signals(self) -> None:
         """Connect signals and slots for the search input."""
         # Text changed signal (with debouncing for auto-search)
+        # Also drives clear button visibility, so each keystroke crosses
+        # into Python once
         self.search_input.textChanged.connect(self._on_text_changed)
 
-        # Clear button visibility
-        self.search_input.textChanged.connect(self._update_clear_button_visibility)
-
         logger.debug("Signals connected")
 
     def _on_text_changed(self, text: str) -> None:
@@ -454,11 +468,14 @@ class SearchInputWidget(QWidget):
         # Emit text changed signal
         self.text_changed.emit(text)
 
-        # Emit query empty state
-        is_empty = not bool(text.strip())
+        # Emit query empty state; strip once and reuse the result below
+        is_empty = not text.strip()
         self.query_empty_changed.emit(is_empty)
 
-        # Restart debounce timer for auto-search
+        # Restart debounce timer for auto-search on user edits
         self._debounce_timer.stop()
-        if self.auto_search_enabled and text.strip():
+        if self.auto_search_enabled and not is_empty and not self._setting_text:
             self._debounce_timer.start(self.auto_search_delay_ms)
+
+        # Clear button visibility
+        self._update_clear_button_visibility(not is_empty)
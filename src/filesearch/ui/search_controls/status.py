@@ -1,5 +1,7 @@
 """Status widget for displaying search status and results count."""
 
+from collections import deque
+
 from loguru import logger
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QContextMenuEvent
@@ -7,6 +9,7 @@ from PyQt6.QtWidgets import QLabel, QMenu, QVBoxLayout, QWidget
 
 from filesearch.core.application_runtime import DesktopEffects
 from filesearch.core.config_manager import ConfigManager
+from filesearch.ui.search_controls.config_save import DebouncedConfigSave
 
 
 class StatusWidget(QWidget):
@@ -24,6 +27,9 @@ class StatusWidget(QWidget):
     # Signals
     status_updated = pyqtSignal(str, int)  # status_message, result_count
 
+    # Delay before the last search summary is written to disk
+    SUMMARY_SAVE_DELAY_MS = 500
+
     def __init__(
         self,
         parent: QWidget | None = None,
@@ -47,13 +53,19 @@ class StatusWidget(QWidget):
         self.search_duration = 0.0
         self.current_status = "ready"  # ready, searching, completed, error
 
+        # Deferred write of the last search summary; the completion handler
+        # only updates the in-memory configuration
+        self._config_save = DebouncedConfigSave(
+            config_manager, "last search summary", self.SUMMARY_SAVE_DELAY_MS, self
+        )
+
         # Setup UI
         self._setup_ui()
         self._setup_style()
 
         # Set initial status
         # Status history for debug mode (last 100 messages)
-        self.status_history: list[str] = []
+        self.status_history: deque[str] = deque(maxlen=100)
 
         self.update_status("ready", 0)
 
@@ -172,9 +184,12 @@ class StatusWidget(QWidget):
                     raise RuntimeError("status persistence requires a config manager")
                 if config.get("ui.audio_notification_on_search_complete", False):
                     self.desktop_effects.beep()
-                # Persist last search summary
-                config.set("ui.last_search_summary", summary_text)
-                config.save()
+                # Persist last search summary; repeating the previous search
+                # leaves the stored summary, and the file, untouched. The file
+                # write is deferred by ``SUMMARY_SAVE_DELAY_MS``.
+                if config.get("ui.last_search_summary") != summary_text:
+                    config.set("ui.last_search_summary", summary_text)
+                    self._config_save.schedule()
             except Exception as e:
                 logger.warning(f"Search completion handling failed: {e}")
 
@@ -186,8 +201,6 @@ class StatusWidget(QWidget):
             f"{status}: {self.results_count_label.text()} - {summary_text}".strip()
         )
         self.status_history.append(message)
-        if len(self.status_history) > 100:
-            self.status_history.pop(0)
 
         logger.debug(f"Status updated: {status}, {result_count} results")
 
@@ -197,7 +210,7 @@ class StatusWidget(QWidget):
         Returns:
             List of last 100 status messages
         """
-        return self.status_history.copy()
+        return list(self.status_history)
 
     def copy_status_to_clipboard(self) -> None:
         """Copy current status message to clipboard."""
@@ -1,37 +1,58 @@
-"""Background search worker thread."""
+"""Background search worker."""
 
+import threading
+import time
 from collections.abc import Callable
 from pathlib import Path
 
 from loguru import logger
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 from filesearch.core.exceptions import FileSearchError
 from filesearch.core.search_engine import FileSearchEngine
+from filesearch.models.search_result import SearchResult
 
 
-class SearchWorker(QThread):
-    """Worker thread for performing file searches in the background.
+class SearchWorkerSignals(QObject):
+    """Signals emitted by a SearchWorker.
 
-    This class handles search operations in a separate thread to keep the UI
-    responsive during searches.
+    QRunnable is not a QObject, so the worker carries its signals on this
+    companion object. It is created on the thread that builds the worker, so
+    connections to GUI-thread slots are queued automatically.
 
     Signals:
-        result_found(Path, int): Emitted when a matching file is found
-        progress_update(int, str, int): Emitted for search progress updates
+        results_found(list, int): Emitted with a batch of SearchResult objects
+            and the running total of files found
         search_complete(int, int): Emitted when search is complete
         error_occurred(str, int): Emitted when an error occurs
         search_stopped(int, int): Emitted when search is stopped
     """
 
-    result_found = pyqtSignal(dict, int)  # result_dict, result_number
-    progress_update = pyqtSignal(
-        int, str, int
-    )  # progress_percent, current_dir, files_found
+    results_found = pyqtSignal(list, int)  # search_results, files_found
     search_complete = pyqtSignal(int, int)  # total_files, total_dirs
     error_occurred = pyqtSignal(str, int)  # error_message, error_code
     search_stopped = pyqtSignal(int, int)  # files_found, dirs_searched
 
+
+class SearchWorker(QRunnable):
+    """Runnable for performing file searches in the background.
+
+    This class handles search operations on a pooled thread to keep the UI
+    responsive during searches. Pool threads are reused across searches, so
+    repeated searches do not pay for OS thread creation. Results are delivered
+    in batches so the number of queued cross-thread signals stays small for
+    large result sets; a short-lived helper thread flushes a batch whose
+    interval expires while the walk finds nothing new.
+
+    Attributes:
+        signals (SearchWorkerSignals): Signals emitted while the search runs
+    """
+
+    # A batch is flushed when it reaches this many results...
+    BATCH_SIZE = 64
+    # ...or when its oldest result has waited this many seconds.
+    BATCH_INTERVAL = 0.05
+
     def __init__(
         self,
         search_engine: FileSearchEngine,
@@ -52,47 +73,154 @@ class SearchWorker(QThread):
         self.directory = directory
         self.query = query
         self.progress_callback = progress_callback
-        self._is_running = False
+        # Set from the UI thread by stop(); polled by run() once per result.
+        self._stop_event = threading.Event()
+        # Set when run() returns; lets wait() block like QThread.wait().
+        self._finished_event = threading.Event()
+        # Pending results are shared by run() and its flusher thread.
+        self._batch_ready = threading.Condition()
+        self._batch: list[SearchResult] = []
+        self._batch_started = 0.0
+        self._files_found = 0
+        self._search_done = False
+        self.signals = SearchWorkerSignals()
+        # MainWindow keeps a reference and may call stop() after run() ends.
+        self.setAutoDelete(False)
 
         logger.debug(f"SearchWorker initialized for {directory} with query '{query}'")
 
     def run(self) -> None:
         """Execute the search operation."""
-        self._is_running = True
-        files_found = 0
+        stop_requested = self._stop_event.is_set
         dirs_searched = 0
+        self._batch = []
+        self._files_found = 0
+        self._search_done = False
+        # A quiet stretch of the walk would otherwise hold back a pending
+        # batch until the next match, so a helper thread flushes it on time.
+        flusher = threading.Thread(
+            target=self._flush_when_due, name="SearchWorkerFlush", daemon=True
+        )
+        flusher.start()
 
         try:
             logger.info(f"Starting search in {self.directory} for '{self.query}'")
 
             # Perform the search (includes plugin results)
             for result in self.search_engine.search(self.directory, self.query):
-                if not self._is_running:
+                if stop_requested():
                     break
 
-                files_found += 1
-                self.result_found.emit(result, files_found)
-
-                # Update progress periodically
-                if files_found % 10 == 0:
-                    self.progress_update.emit(50, str(self.directory), files_found)
-
-            if self._is_running:
-                self.search_complete.emit(files_found, dirs_searched)
+                # Build the SearchResult here so Path construction stays off
+                # the UI thread.
+                self._queue_result(
+                    SearchResult(
+                        path=Path(result["path"]),
+                        size=result["size"],
+                        modified=result["modified"],
+                        plugin_source=result.get("source"),
+                        is_dir=result.get("is_directory"),
+                    )
+                )
+
+            with self._batch_ready:
+                self._flush_batch()
+            files_found = self._files_found
+
+            if not stop_requested():
+                self.signals.search_complete.emit(files_found, dirs_searched)
                 logger.info(f"Search completed: {files_found} files found")
             else:
-                self.search_stopped.emit(files_found, dirs_searched)
+                self.signals.search_stopped.emit(files_found, dirs_searched)
                 logger.info(f"Search stopped: {files_found} files found")
 
         except FileSearchError as e:
             logger.error(f"Search error: {e}")
-            self.error_occurred.emit(str(e), 1)
+            self.signals.error_occurred.emit(str(e), 1)
         except Exception as e:
             logger.error(f"Unexpected search error: {e}")
-            self.error_occurred.emit(f"Unexpected error: {e}", 2)
+            self.signals.error_occurred.emit(f"Unexpected error: {e}", 2)
+        finally:
+            self._stop_flusher(flusher)
+            self._finished_event.set()
+
+    def _queue_result(self, result: SearchResult) -> None:
+        """Add a result to the pending batch, flushing it once it is full.
+
+        Args:
+            result: Result produced by the search engine
+        """
+        with self._batch_ready:
+            self._batch.append(result)
+            self._files_found += 1
+            if len(self._batch) >= self.BATCH_SIZE:
+                self._flush_batch()
+            elif len(self._batch) == 1:
+                # Start the interval for this batch on the flusher thread
+                self._batch_started = time.monotonic()
+                self._batch_ready.notify()
+
+    def _flush_when_due(self) -> None:
+        """Flush a pending batch once it has waited BATCH_INTERVAL seconds.
+
+        Runs on a helper thread for the duration of run(), so a match is
+        delivered on time even when no further result arrives to flush it.
+        """
+        with self._batch_ready:
+            while not self._search_done:
+                if not self._batch:
+                    self._batch_ready.wait()
+                    continue
+                remaining = self._batch_started + self.BATCH_INTERVAL
+                remaining -= time.monotonic()
+                if remaining > 0:
+                    self._batch_ready.wait(remaining)
+                    continue
+                self._flush_batch()
+
+    def _stop_flusher(self, flusher: threading.Thread) -> None:
+        """Stop the flusher thread started by run().
+
+        Args:
+            flusher: Helper thread started by run()
+        """
+        with self._batch_ready:
+            self._search_done = True
+            self._batch_ready.notify()
+        flusher.join()
+
+    def _flush_batch(self) -> None:
+        """Emit the pending batch together with the running total.
+
+        The running total doubles as the progress report, so each flush costs
+        a single queued event on the GUI thread. Callers hold _batch_ready.
+        """
+        if not self._batch:
+            return
+        batch = self._batch
+        self._batch = []
+        self.signals.results_found.emit(batch, self._files_found)
+
+    def start(self) -> None:
+        """Submit the search to the global thread pool."""
+        pool = QThreadPool.globalInstance()
+        if pool is None:
+            raise RuntimeError("Global thread pool is unavailable")
+        pool.start(self)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until run() has returned.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever
+
+        Returns:
+            True if the search finished, False if the timeout expired
+        """
+        return self._finished_event.wait(timeout)
 
     def stop(self) -> None:
         """Stop the search operation."""
-        self._is_running = False
+        self._stop_event.set()
         self.search_engine.cancel()
         logger.info("SearchWorker stop requested")
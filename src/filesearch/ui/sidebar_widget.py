@@ -123,14 +123,8 @@ FILE_TYPE_EXTENSIONS: dict[str, set[str]] = {
     },
 }
 
-# Tag badge color rotation
-TAG_COLORS = [
-    Colors.TAG_BLUE,
-    Colors.TAG_GREEN,
-    Colors.TAG_PURPLE,
-    Colors.TAG_YELLOW,
-    Colors.TAG_RED,
-]
+# Tag badge tone rotation; each tone is styled by the global theme
+TAG_TONES = ["blue", "green", "purple", "yellow", "red"]
 
 
 class SidebarWidget(QWidget):
@@ -476,12 +470,11 @@ class SidebarWidget(QWidget):
                 row.setSpacing(4)
                 self._tags_container.addLayout(row)
 
-            color = TAG_COLORS[i % len(TAG_COLORS)]
             btn = QPushButton(text)
             btn.setProperty("class", "tag-badge")
+            btn.setProperty("tone", TAG_TONES[i % len(TAG_TONES)])
             btn.setToolTip(text)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet(f"background-color: {color};")
             btn.setMaximumWidth(100)
             btn.clicked.connect(lambda checked, t=text: self.tag_clicked.emit(t))
             self._tag_buttons.append(btn)
@@ -266,11 +266,6 @@ QLabel[class="file-counter"] {{
     font-weight: {Fonts.WEIGHT_SEMIBOLD};
 }}
 
-QLabel[class="loading-indicator"] {{
-    color: {Colors.PRIMARY};
-    font-size: {Fonts.SIZE_LG}pt;
-}}
-
 QLabel[class="sort-label"] {{
     font-size: {Fonts.SIZE_SM}pt;
     color: {Colors.TEXT_TERTIARY};
@@ -378,19 +373,6 @@ QToolButton:hover {{
     color: {Colors.TEXT_PRIMARY};
 }}
 
-QToolButton[class="clear-button"] {{
-    border: none;
-    background: transparent;
-    color: {Colors.TEXT_TERTIARY};
-    font-size: {Fonts.SIZE_LG}pt;
-}}
-
-QToolButton[class="clear-button"]:hover {{
-    color: {Colors.TEXT_PRIMARY};
-    background: {Colors.BG_TERTIARY};
-    border-radius: {Spacing.RADIUS_SM}px;
-}}
-
 /* ===== Combo Box ===== */
 QComboBox {{
     font-size: {Fonts.SIZE_BASE}pt;
@@ -801,6 +783,26 @@ QPushButton[class="tag-badge"]:hover {{
     opacity: 0.8;
 }}
 
+QPushButton[class="tag-badge"][tone="blue"] {{
+    background-color: {Colors.TAG_BLUE};
+}}
+
+QPushButton[class="tag-badge"][tone="green"] {{
+    background-color: {Colors.TAG_GREEN};
+}}
+
+QPushButton[class="tag-badge"][tone="purple"] {{
+    background-color: {Colors.TAG_PURPLE};
+}}
+
+QPushButton[class="tag-badge"][tone="yellow"] {{
+    background-color: {Colors.TAG_YELLOW};
+}}
+
+QPushButton[class="tag-badge"][tone="red"] {{
+    background-color: {Colors.TAG_RED};
+}}
+
 /* Storage bar */
 QProgressBar[class="storage-bar"] {{
     border: none;
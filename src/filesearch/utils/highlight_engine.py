@@ -7,6 +7,10 @@ matching, wildcard support, and regex metacharacter escaping.
 
 import re
 
+# Characters that make a query more than a literal substring: wildcards plus
+# anything re would interpret, since queries are compiled unescaped
+_PATTERN_CHARS = frozenset(".^$*+?()[]{}|\\")
+
 
 class HighlightEngine:
     """Engine for highlighting matching text in search results"""
@@ -130,18 +134,20 @@ class HighlightEngine:
         if cache_key in self._highlight_cache:
             return self._highlight_cache[cache_key]
 
-        pattern = self._compile_pattern(query, case_sensitive)
-        if pattern is None:
-            return []
-
-        matches = []
-
         # Remove extension for highlighting purposes
         name_without_ext, _ext = self._split_filename_and_ext(filename)
 
-        # Find all matches in the filename (without extension)
-        for match in pattern.finditer(name_without_ext):
-            matches.append((match.start(), match.end()))
+        matches = self._find_literal(name_without_ext, query, case_sensitive)
+        if matches is None:
+            pattern = self._compile_pattern(query, case_sensitive)
+            if pattern is None:
+                return []
+
+            # Find all matches in the filename (without extension)
+            matches = [
+                (match.start(), match.end())
+                for match in pattern.finditer(name_without_ext)
+            ]
 
         # Cache the results
         self._highlight_cache[cache_key] = matches
@@ -152,6 +158,38 @@ class HighlightEngine:
 
         return matches
 
+    def _find_literal(
+        self, text: str, query: str, case_sensitive: bool
+    ) -> list[tuple[int, int]] | None:
+        """
+        Find plain-substring matches with str.find, skipping the regex engine
+
+        Args:
+            text: The text to search in
+            query: The search query
+            case_sensitive: Whether matching should be case sensitive
+
+        Returns:
+            Non-overlapping (start, end) spans, or None when the query needs
+            the regex path (pattern characters, or non-ASCII text where
+            str.lower() and re.IGNORECASE disagree)
+        """
+        if not _PATTERN_CHARS.isdisjoint(query):
+            return None
+        if not case_sensitive:
+            if not (query.isascii() and text.isascii()):
+                return None
+            text = text.lower()
+            query = query.lower()
+
+        matches = []
+        step = len(query)
+        start = text.find(query)
+        while start != -1:
+            matches.append((start, start + step))
+            start = text.find(query, start + step)
+        return matches
+
     def _split_filename_and_ext(self, filename: str) -> tuple[str, str]:
         """
         Split filename into name and extension parts
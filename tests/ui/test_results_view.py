@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import QApplication, QListView
 
 from filesearch.models.search_result import SearchResult
 from filesearch.ui.results_view import ResultsView
@@ -58,6 +58,8 @@ def test_results_view_initialization(results_view):
     assert results_view is not None
     assert results_view.minimumHeight() == 200
     assert results_view.model() is not None
+    assert results_view.uniformItemSizes() is True
+    assert results_view.layoutMode() == QListView.LayoutMode.Batched
 
 
 def test_add_single_result(results_view, sample_results):
@@ -161,6 +163,49 @@ def test_performance_large_result_set(results_view):
     assert len(results_view.model().get_all_results()) == 1000
 
 
+def test_highlight_changes_coalesce_into_one_repaint(results_view, qtbot):
+    """A burst of highlight setting changes schedules a single repaint."""
+    results_view.set_query("doc")
+    results_view.set_highlight_color("#FFCC00")
+    results_view.set_highlight_style("underline")
+
+    assert results_view._repaint_timer.isActive()
+    qtbot.waitUntil(lambda: not results_view._repaint_timer.isActive())
+    assert results_view._delegate.highlight_style == "underline"
+
+
+def test_page_keys_move_by_one_viewport_of_rows(results_view, qtbot):
+    """PageDown/PageUp move the selection by the rows that fit on screen."""
+    results = [
+        SearchResult(path=Path(f"/test/file{i}.txt"), size=1, modified=0)
+        for i in range(50)
+    ]
+    results_view.resize(400, 64 * 5 + 10)
+    results_view.set_results(results)
+    results_view.setCurrentIndex(results_view.model().index(0, 0))
+    rows_per_page = results_view.viewport().height() // 64
+
+    qtbot.keyClick(results_view, Qt.Key.Key_PageDown)
+    assert results_view.currentIndex().row() == rows_per_page
+
+    qtbot.keyClick(results_view, Qt.Key.Key_PageUp)
+    assert results_view.currentIndex().row() == 0
+
+
+def test_model_batch_grows_with_tall_viewports(results_view):
+    """Tall views reveal several screens of rows per fetch, never under 100."""
+    results = [
+        SearchResult(path=Path(f"/test/file{i}.txt"), size=1, modified=0)
+        for i in range(1000)
+    ]
+    results_view.resize(400, 64 * 40)
+    results_view.set_results(results)
+
+    rows_per_page = results_view.viewport().height() // 64
+    assert results_view.model().rowCount() == max(100, rows_per_page * 4)
+    assert results_view.batchSize() == 256
+
+
 def test_search_result_display_methods(sample_results):
     """Test SearchResult display methods."""
     result = sample_results[0]  # document.txt, 1024 bytes
@@ -173,6 +218,10 @@ def test_search_result_display_methods(sample_results):
     folder_result = sample_results[2]
     assert folder_result.get_display_size() == "Folder"
 
+    # Timestamps the platform cannot convert fall back to a placeholder
+    out_of_range = SearchResult(path=Path("/test/old.txt"), size=1, modified=1e20)
+    assert out_of_range.get_display_date() == "Unknown"
+
 
 def test_empty_state_messages(results_view):
     """Test different empty state messages."""
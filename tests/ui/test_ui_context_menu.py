@@ -1,4 +1,5 @@
 import pytest
+from PyQt6.QtCore import QPoint
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import QMenu
 
@@ -188,3 +189,55 @@ def test_context_menu_multi_selection(main_window, add_search_results):
         "Copy File to Clipboard should be enabled for multi-selection"
     )
     assert delete_action.isEnabled(), "Delete should be enabled for multi-selection"
+
+
+def test_context_menu_is_reused_across_requests(main_window, add_search_results):
+    """The context menu is built once and only reconfigured per selection."""
+    multi_menu = main_window._create_context_menu(add_search_results)
+    properties_action = get_action_by_text(multi_menu, "Properties")
+    assert not properties_action.isEnabled()
+
+    single_menu = main_window._create_context_menu([add_search_results[0]])
+
+    assert single_menu is multi_menu
+    assert get_action_by_text(single_menu, "Properties") is properties_action
+    assert properties_action.isEnabled()
+    assert get_action_by_text(single_menu, "Rename").isEnabled()
+
+
+def test_context_menu_action_dispatches_to_handler(
+    main_window, add_search_results, desktop_effects
+):
+    """Triggering a menu action routes through the shared dispatch slot."""
+    context_menu = main_window._create_context_menu([add_search_results[0]])
+
+    get_action_by_text(context_menu, "Copy Path to Clipboard").trigger()
+
+    assert desktop_effects.copied_text == [str(add_search_results[0].path)]
+
+
+def test_context_menu_is_prewarmed_when_idle(main_window, qtbot):
+    """The context menu is built on an idle timer after window construction."""
+    qtbot.waitUntil(lambda: main_window._context_menu is not None, timeout=1000)
+
+    assert main_window._create_context_menu([]) is main_window._context_menu
+
+
+def test_context_menu_pauses_status_clock_while_open(
+    main_window, add_search_results, monkeypatch
+):
+    """The status bar clock is stopped while the modal menu is shown."""
+    main_window.results_view.selectAll()
+    timer_active_during_exec = []
+    monkeypatch.setattr(
+        QMenu,
+        "exec",
+        lambda menu, pos: timer_active_during_exec.append(
+            main_window.time_update_timer.isActive()
+        ),
+    )
+
+    main_window._on_context_menu_requested(QPoint(0, 0))
+
+    assert timer_active_during_exec == [False]
+    assert main_window.time_update_timer.isActive()
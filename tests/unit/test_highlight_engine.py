@@ -1,5 +1,7 @@
 """Unit tests for HighlightEngine"""
 
+import re
+
 import pytest
 
 from filesearch.utils.highlight_engine import HighlightEngine, is_valid_highlight_query
@@ -122,6 +124,21 @@ class TestHighlightEngine:
         assert len(matches) == 1
         assert matches[0] == (0, 6)
 
+    def test_literal_queries_match_like_the_regex_path(self, engine):
+        """Plain substring queries give the same spans as the regex engine"""
+        cases = [
+            ("Test_TEST_test.txt", "test", False),
+            ("Test_TEST_test.txt", "TEST", True),
+            ("aaaa.txt", "aa", False),
+            ("Straße_STRASSE.txt", "strasse", False),
+            ("report-2024 final.doc", "2024 f", False),
+        ]
+        for filename, query, case_sensitive in cases:
+            name, _ext = engine._split_filename_and_ext(filename)
+            flags = 0 if case_sensitive else re.IGNORECASE
+            expected = [m.span() for m in re.finditer(re.escape(query), name, flags)]
+            assert engine.find_matches(filename, query, case_sensitive) == expected
+
     def test_caching_works(self, engine):
         """Test that pattern and highlight caching works correctly"""
         query = "test"
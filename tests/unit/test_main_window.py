@@ -62,23 +62,21 @@ class TestSearchWorker:
         """Test SearchWorker initialization."""
         assert search_worker.directory == Path("/test")
         assert search_worker.query == "*.txt"
-        assert search_worker._is_running is False
+        assert search_worker._stop_event.is_set() is False
         assert isinstance(search_worker.search_engine, FileSearchEngine)
 
     def test_search_worker_signals(self, search_worker):
         """Test that SearchWorker has required signals."""
-        assert hasattr(search_worker, "result_found")
-        assert hasattr(search_worker, "progress_update")
-        assert hasattr(search_worker, "search_complete")
-        assert hasattr(search_worker, "error_occurred")
-        assert hasattr(search_worker, "search_stopped")
+        assert hasattr(search_worker.signals, "results_found")
+        assert hasattr(search_worker.signals, "search_complete")
+        assert hasattr(search_worker.signals, "error_occurred")
+        assert hasattr(search_worker.signals, "search_stopped")
 
     def test_search_worker_stop(self, search_worker):
         """Test stopping the search worker."""
-        search_worker._is_running = True
         search_worker.stop()
 
-        assert search_worker._is_running is False
+        assert search_worker._stop_event.is_set() is True
         assert search_worker.search_engine._cancelled is True
 
 
@@ -149,6 +147,28 @@ class TestMainWindowUIState:
         assert width == 1000
         assert height == 600
 
+    def test_status_clock_runs_only_while_window_is_shown(self, main_window):
+        """The 1 Hz status bar clock is paused while the window is hidden."""
+        assert not main_window.time_update_timer.isActive()
+
+        main_window.show()
+        assert main_window.time_update_timer.isActive()
+        assert main_window.time_label.text()
+
+        main_window.hide()
+        assert not main_window.time_update_timer.isActive()
+
+    def test_load_highlight_settings_applies_case_sensitivity(self, main_window):
+        """Highlight settings from config reach the results delegate."""
+        main_window.config_manager.set("highlighting.case_sensitive", True)
+        main_window.config_manager.set("highlighting.color", "#ABCDEF")
+
+        main_window._load_highlight_settings()
+
+        delegate = main_window.results_view._delegate
+        assert delegate.highlight_case_sensitive is True
+        assert delegate.highlight_color == "#ABCDEF"
+
     def test_center_tabs_include_search_and_storage(self, main_window):
         """The center area exposes Search and Storage tabs."""
         tab_labels = [
@@ -278,6 +298,48 @@ class TestMainWindowSearchControls:
 
                 assert main_window.search_control.get_state() == SearchState.RUNNING
 
+    def test_search_wait_cursor_is_paired_application_override(
+        self, main_window, tmp_path
+    ):
+        """A running search pushes one override cursor and reset pops it."""
+        main_window.current_directory = tmp_path
+        main_window.query_input.set_text("*.txt")
+
+        with patch("filesearch.ui.main_window.SearchWorker"):
+            main_window.start_search()
+
+        assert QApplication.overrideCursor().shape() == Qt.CursorShape.WaitCursor
+
+        main_window.reset_search_ui()
+        main_window.reset_search_ui()
+
+        assert QApplication.overrideCursor() is None
+
+    def test_enter_right_after_typing_searches_the_typed_directory(
+        self, qtbot, config_manager, tmp_path
+    ):
+        """A path typed just before Enter is searched, not the previous one."""
+        typed_dir = tmp_path / "typed"
+        typed_dir.mkdir()
+
+        window = MainWindow(config_manager=config_manager)
+        window.show()
+        qtbot.addWidget(window)
+
+        try:
+            window.query_input.set_text("*.txt")
+            directory_input = window.directory_selector.directory_input
+            directory_input.clear()
+            qtbot.keyClicks(directory_input, str(typed_dir))
+
+            with patch.object(window, "_start_search_request") as mock_start:
+                qtbot.keyPress(directory_input, Qt.Key.Key_Return)
+
+            mock_start.assert_called_once()
+            assert mock_start.call_args.args[0].directory == typed_dir.resolve()
+        finally:
+            window.close()
+
     def test_start_search_while_running_queues_restart(self, main_window, tmp_path):
         """Starting a new search cancels the current worker and stores latest input."""
         first_dir = tmp_path / "first"
@@ -366,7 +428,7 @@ class TestMainWindowSearchControls:
         main_window._cancel_requested = True
         main_window.safe_status_message("Restarting search...")
 
-        main_window.on_progress_update(50, "/old", 10)
+        main_window.on_results_found([], 10)
 
         assert main_window.statusBar().currentMessage() == "Restarting search..."
 
@@ -662,28 +724,61 @@ class TestMainWindowDirectorySelection:
 class TestMainWindowResultHandling:
     """Test cases for MainWindow result handling."""
 
-    def test_on_result_found(self, main_window):
-        """Test handling found search results."""
-        test_result = {
-            "path": "/test/file.txt",
-            "name": "file.txt",
-            "source": "filesystem",
-            "size": 100,
-            "modified": 1234567890,
-        }
+    def test_on_results_found(self, main_window):
+        """Test handling a batch of found search results."""
+        test_results = [
+            SearchResult(
+                path=Path(f"/test/file{index}.txt"),
+                size=100,
+                modified=1234567890,
+                plugin_source="filesystem",
+            )
+            for index in range(3)
+        ]
+
+        main_window.on_results_found(test_results, 3)
 
-        main_window.on_result_found(test_result, 1)
+        assert main_window.search_results == test_results
+        assert main_window.results_view.model().rowCount() == 3
+        assert "Found 3 files" in main_window.statusBar().currentMessage()
 
-        assert len(main_window.search_results) == 1
-        assert main_window.search_results[0] == test_result
+    def test_on_results_found_reports_progress_for_active_directory(
+        self, main_window, qtbot, tmp_path
+    ):
+        """Each batch refreshes the progress message for the active search."""
+        main_window._progress_status_prefix = f"Searching {tmp_path}... Found "
 
-    def test_on_progress_update(self, main_window):
-        """Test handling progress updates."""
-        main_window.on_progress_update(50, "/test/dir", 10)
+        main_window.on_results_found([], 64)
+        main_window.on_results_found([], 128)
 
-        status_message = main_window.statusBar().currentMessage()
-        assert "Searching /test/dir" in status_message
-        assert "Found 10 files" in status_message
+        qtbot.waitUntil(
+            lambda: (
+                main_window.statusBar().currentMessage()
+                == f"Searching {tmp_path}... Found 128 files"
+            )
+        )
+
+    def test_streaming_status_updates_are_throttled(self, main_window, qtbot):
+        """Batch progress coalesces to the latest message within the interval."""
+        main_window.on_results_found([], 64)
+        main_window.on_results_found([], 128)
+        main_window.on_results_found([], 192)
+
+        status_bar = main_window.statusBar()
+        assert status_bar.currentMessage() == "Found 64 files"
+        qtbot.waitUntil(lambda: status_bar.currentMessage() == "Found 192 files")
+
+    def test_immediate_status_replaces_pending_throttled_status(
+        self, main_window, qtbot
+    ):
+        """A final status message is not overwritten by a late progress flush."""
+        main_window.on_results_found([], 64)
+        main_window.on_results_found([], 128)
+        main_window.safe_status_message("Search complete")
+
+        qtbot.wait(150)
+
+        assert main_window.statusBar().currentMessage() == "Search complete"
 
     def test_on_search_complete(self, main_window):
         """Test handling search completion."""
@@ -700,6 +795,43 @@ class TestMainWindowResultHandling:
         status_message = main_window.statusBar().currentMessage()
         assert "Found 5 results" in status_message
 
+    def test_on_search_complete_sorts_streamed_results_once(self, main_window):
+        """Streamed results are sorted by the selected criteria at completion."""
+        from filesearch.core.sort_engine import SortCriteria
+
+        results = [
+            SearchResult(path=Path(f"/test/{name}.txt"), size=1, modified=0)
+            for name in ("zebra", "alpha", "mango")
+        ]
+        main_window.sort_controls.set_criteria(SortCriteria.NAME_ASC)
+        main_window.is_searching = True
+        main_window.on_results_found(results, 3)
+
+        main_window.on_search_complete(3, 1)
+
+        model = main_window.results_view.model()
+        names = [model.index(row, 0).data() for row in range(model.rowCount())]
+        assert names == ["alpha.txt", "mango.txt", "zebra.txt"]
+
+    def test_on_search_complete_keeps_the_selected_result(self, main_window):
+        """Completion sorting keeps the user's selection on the same result."""
+        from filesearch.core.sort_engine import SortCriteria
+
+        results = [
+            SearchResult(path=Path(f"/test/{name}.txt"), size=1, modified=0)
+            for name in ("zebra", "alpha", "mango")
+        ]
+        main_window.sort_controls.set_criteria(SortCriteria.NAME_ASC)
+        main_window.is_searching = True
+        main_window.on_results_found(results, 3)
+        view = main_window.results_view
+        view.setCurrentIndex(view.model().index(0, 0))
+
+        main_window.on_search_complete(3, 1)
+
+        assert view.get_selected_result() is results[0]
+        assert view.currentIndex().row() == 2
+
     def test_on_search_stopped(self, main_window):
         """Test handling search stop."""
         main_window.is_searching = True
@@ -1011,17 +1143,14 @@ class TestIdleFolderListing:
             assert selected.path == target
 
             # Open path reuses the same handler as search results
-            with patch.object(  # noqa: SIM117 - staged security mocks aid readability.
-                window, "_open_file_with_status"
-            ) as mock_open:
-                with patch(
-                    "filesearch.core.security_manager.get_security_manager"
-                ) as mock_sec:
-                    sec = Mock()
-                    sec.should_warn_before_opening.return_value = (False, "")
-                    mock_sec.return_value = sec
-                    window._on_file_open_requested(selected)
-                    mock_open.assert_called_once_with(target)
+            sec = Mock()
+            sec.should_warn_before_opening.return_value = (False, "")
+            with (
+                patch.object(window, "_open_file_with_status") as mock_open,
+                patch.object(window, "_security_manager", sec),
+            ):
+                window._on_file_open_requested(selected)
+                mock_open.assert_called_once_with(target)
         finally:
             window.close()
 
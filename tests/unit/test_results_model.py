@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QPersistentModelIndex, Qt
 
 from filesearch.core.sort_engine import SortCriteria
 from filesearch.models.search_result import SearchResult
@@ -34,13 +34,18 @@ def test_model_renames_a_result_and_reports_rename_errors(tmp_path, qtbot):
     original.write_text("content")
     collision = tmp_path / "existing.txt"
     collision.write_text("content")
+    result = make_result(original)
     model = ResultsModel()
-    model.add_result(make_result(original))
+    model.add_result(result)
     index = model.index(0)
+    assert result.get_display_path().endswith("draft.txt")
+    assert "Filename: draft.txt" in model.data(index, Qt.ItemDataRole.ToolTipRole)
 
     with qtbot.waitSignal(model.dataChanged):
         assert model.setData(index, "final.txt") is True
     assert model.data(index) == "final.txt"
+    assert result.get_display_path().endswith("final.txt")
+    assert "Filename: final.txt" in model.data(index, Qt.ItemDataRole.ToolTipRole)
     assert (tmp_path / "final.txt").exists()
     assert model.setData(index, "final.txt") is False
 
@@ -71,6 +76,42 @@ def test_model_filters_adds_removes_and_clears_results(tmp_path):
     assert model.get_all_results() == []
 
 
+def test_model_removes_results_by_identity_and_keeps_rows_in_sync(tmp_path):
+    results = [make_result(tmp_path / f"file{i}.txt") for i in range(4)]
+    model = ResultsModel()
+    model.add_results(results[:2])
+    model.add_results(results[2:])
+
+    assert model.remove_result(make_result(tmp_path / "file1.txt")) is False
+    assert model.remove_result(results[1]) is True
+    assert model.remove_result(results[3]) is True
+    assert model.remove_result(results[1]) is False
+    assert model.get_all_results() == [results[0], results[2]]
+    assert model.data(model.index(1)) == "file2.txt"
+
+    model.set_results(results[2:])
+    assert model.remove_result(results[0]) is False
+    assert model.remove_result(results[3]) is True
+    assert model.get_all_results() == [results[2]]
+
+
+def test_model_adds_a_batch_with_one_row_insertion(tmp_path):
+    results = [make_result(tmp_path / f"item-{index}.py") for index in range(5)]
+    model = ResultsModel()
+    model.set_extension_filter([".py"])
+    inserted = []
+    model.rowsInserted.connect(
+        lambda _parent, first, last: inserted.append((first, last))
+    )
+
+    model.add_results([*results[:3], make_result(tmp_path / "skipped.txt")])
+    model.add_results(results[3:])
+
+    assert inserted == [(0, 2), (3, 4)]
+    assert model.rowCount() == 5
+    assert model.get_all_results() == results
+
+
 def test_model_fetches_large_result_sets_in_batches(tmp_path):
     results = [make_result(tmp_path / f"item-{index:03}.txt") for index in range(205)]
     model = ResultsModel()
@@ -107,3 +148,85 @@ def test_model_sorts_results_and_remembers_the_query(tmp_path):
     empty = ResultsModel()
     empty.sort_results(SortCriteria.NAME_ASC)
     assert empty.get_current_sort_criteria() is None
+
+
+def test_model_sort_keeps_results_hidden_by_the_extension_filter(tmp_path):
+    notes = make_result(tmp_path / "notes.txt")
+    script = make_result(tmp_path / "script.py")
+    archive = make_result(tmp_path / "archive.txt")
+    model = ResultsModel()
+    model.set_results([notes, script, archive])
+    model.set_extension_filter([".txt"])
+
+    model.sort_results(SortCriteria.NAME_ASC)
+    assert model.get_all_results() == [archive, notes]
+
+    model.set_extension_filter([])
+    assert model.get_all_results() == [archive, notes, script]
+
+
+def test_model_sort_moves_persistent_rows_without_a_reset(tmp_path, qtbot):
+    results = [make_result(tmp_path / f"{name}.txt") for name in ("c", "a", "b")]
+    model = ResultsModel()
+    model.set_batch_size(2)
+    model.set_results(results)
+    model.fetchMore()
+    selected = QPersistentModelIndex(model.index(0))
+
+    with (
+        qtbot.assertNotEmitted(model.modelReset),
+        qtbot.waitSignal(model.layoutChanged),
+    ):
+        model.sort_results(SortCriteria.NAME_ASC)
+
+    assert model.rowCount() == 3
+    assert selected.row() == 2
+    assert selected.data(Qt.ItemDataRole.UserRole) is results[0]
+
+
+def test_model_sort_skips_results_already_in_order(tmp_path, qtbot):
+    model = ResultsModel()
+    model.set_results(
+        [make_result(tmp_path / "alpha.txt"), make_result(tmp_path / "beta.txt")]
+    )
+
+    with (
+        qtbot.assertNotEmitted(model.layoutAboutToBeChanged),
+        qtbot.assertNotEmitted(model.modelReset),
+    ):
+        model.sort_results(SortCriteria.NAME_ASC)
+
+    assert model.get_current_sort_criteria() is SortCriteria.NAME_ASC
+
+
+def test_model_sort_after_removal_does_not_restore_the_deleted_result(tmp_path):
+    alpha, beta, gamma = (
+        make_result(tmp_path / f"{name}.txt") for name in ("a", "b", "c")
+    )
+    model = ResultsModel()
+    model.set_results([alpha, beta, gamma])
+
+    assert model.remove_result(alpha)
+    model.sort_results(SortCriteria.NAME_DESC)
+
+    assert model.get_all_results() == [gamma, beta]
+    assert [model.index(row).data() for row in range(model.rowCount())] == [
+        "c.txt",
+        "b.txt",
+    ]
+
+    model.set_extension_filter([])
+    assert model.get_all_results() == [gamma, beta]
+
+
+def test_model_sort_after_removing_the_last_sorted_result(tmp_path):
+    alpha, beta, gamma = (
+        make_result(tmp_path / f"{name}.txt") for name in ("a", "b", "c")
+    )
+    model = ResultsModel()
+    model.set_results([alpha, beta, gamma])
+
+    assert model.remove_result(gamma)
+    model.sort_results(SortCriteria.NAME_ASC)
+
+    assert model.get_all_results() == [alpha, beta]
@@ -23,6 +23,7 @@ from filesearch.ui.search_controls import (
     SearchState,
     StatusWidget,
 )
+from filesearch.ui.search_controls.config_save import DebouncedConfigSave
 
 SYNTHETIC_TMP_ROOT = "/tmp"  # noqa: S108 - paths are mocked, never accessed.
 
@@ -125,10 +126,16 @@ class TestSearchInputWidget:
     def test_clear_button_explains_its_action_accessibly(self, widget):
         """The icon-only clear action is named for hover and assistive tech."""
         assert widget.clear_button.toolTip()
-        assert widget.clear_button.accessibleName() == widget.clear_button.toolTip()
-        assert widget.clear_button.accessibleDescription() == (
-            widget.clear_button.toolTip()
-        )
+        assert widget.clear_button.text() == widget.clear_button.toolTip()
+
+    def test_clear_button_lives_inside_the_line_edit(self, widget, qtbot):
+        """The clear action is a line-edit action, not a separate layout widget."""
+        assert widget.clear_button in widget.search_input.actions()
+
+        widget.set_text("test")
+        widget.clear_button.trigger()
+
+        assert widget.get_text() == ""
 
     def test_max_length_validation(self, widget):
         """Test maximum length validation (255 characters) (AC #2)."""
@@ -177,6 +184,18 @@ class TestSearchInputWidget:
         # Check all text is selected
         assert widget.search_input.selectedText() == "test_text"
 
+    def test_ctrl_l_selects_all_text_with_extra_modifier_flags(self, widget, qtbot):
+        """Ctrl+L still selects all when the event carries extra modifier flags."""
+        qtbot.keyClicks(widget.search_input, "test_text")
+
+        qtbot.keyPress(
+            widget.search_input,
+            Qt.Key.Key_L,
+            Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier,
+        )
+
+        assert widget.search_input.selectedText() == "test_text"
+
     def test_search_history_persistence(self, widget, config_manager, qtbot):
         """Test search history is saved across restarts (AC #2)."""
         # Perform a search
@@ -193,7 +212,7 @@ class TestSearchInputWidget:
         """Test search history dropdown accessible via down arrow (AC #2)."""
         # Add some history
         widget.search_history = ["search1", "search2", "search3"]
-        widget._setup_completer()
+        widget._refresh_completer()
 
         # Focus widget and press down arrow
         widget.search_input.setFocus()
@@ -208,7 +227,7 @@ class TestSearchInputWidget:
         """Test auto-complete suggestions from recent searches (AC #2)."""
         # Setup history
         widget.search_history = ["document", "download", "desktop"]
-        widget._setup_completer()
+        widget._refresh_completer()
 
         # Type partial match
         widget.search_input.setFocus()
@@ -217,7 +236,7 @@ class TestSearchInputWidget:
         # Should have completer with suggestions
         completer = widget.search_input.completer()
         assert completer is not None
-        assert len(widget.search_history) > 0
+        assert completer.model().stringList() == ["document", "download", "desktop"]
 
     def test_visual_feedback_focus_states(self, widget, qtbot):
         """Test visual feedback for focus states (AC #4)."""
@@ -246,6 +265,19 @@ class TestSearchInputWidget:
         assert not widget.has_error
         assert widget.search_input.property("state") == "normal"
 
+    def test_unchanged_input_state_skips_repolish(self, widget):
+        """Re-applying the current state does not re-polish the input."""
+        widget.set_error_state(True)
+        style = widget.search_input.style()
+
+        with patch.object(style, "polish") as polish:
+            widget.set_error_state(True)
+            widget.set_loading_state(False)
+            widget.set_error_state(False)
+
+        assert polish.call_count == 1
+        assert widget.search_input.property("state") == "normal"
+
     def test_loading_indicator(self, widget):
         """Test loading indicator appears during search (AC #4)."""
         # Set loading state
@@ -260,6 +292,10 @@ class TestSearchInputWidget:
         assert not widget.is_loading
         assert not widget.loading_indicator.isVisible()
 
+    def test_loading_indicator_lives_inside_the_line_edit(self, widget):
+        """The loading icon is a line-edit action, not a separate layout widget."""
+        assert widget.loading_indicator in widget.search_input.actions()
+
     def test_accessibility_screen_reader_support(self, widget, qtbot):
         """Test screen reader announcements and ARIA labels (AC #5)."""
         # Test accessibility attributes
@@ -298,6 +334,29 @@ class TestSearchInputWidget:
         # Search should not be initiated
         assert not search_initiated_called
 
+    def test_programmatic_text_changes_emit_once(self, widget):
+        """set_text/clear_text notify listeners once per actual change."""
+        texts_received = []
+        empty_states = []
+        widget.text_changed.connect(texts_received.append)
+        widget.query_empty_changed.connect(empty_states.append)
+
+        widget.set_text("report")
+        widget.clear_text()
+
+        assert texts_received == ["report", ""]
+        assert empty_states == [False, True]
+
+    def test_programmatic_text_does_not_schedule_auto_search(self, widget, qtbot):
+        """Only user edits start the auto-search debounce."""
+        widget.auto_search_enabled = True
+
+        widget.set_text("report")
+        assert not widget._debounce_timer.isActive()
+
+        qtbot.keyClicks(widget.search_input, "s")
+        assert widget._debounce_timer.isActive()
+
     def test_text_changed_signal(self, widget, qtbot):
         """Test text_changed signal emission."""
         texts_received = []
@@ -326,6 +385,21 @@ class TestSearchInputWidget:
         assert "search_14" in widget.search_history  # Most recent
         assert "search_0" not in widget.search_history  # Oldest should be gone
 
+    def test_search_history_writes_are_debounced(self, widget, config_manager, qtbot):
+        """A burst of searches updates the config at once but writes it once."""
+        with patch.object(config_manager, "save") as save:
+            for query in ("alpha", "beta", "gamma"):
+                widget.set_text(query)
+                qtbot.keyPress(widget.search_input, Qt.Key.Key_Return)
+
+            assert config_manager.get("recent.searches")[0] == "gamma"
+            assert save.call_count == 0
+            qtbot.waitUntil(lambda: save.call_count == 1)
+
+            widget._save_search_history()
+            widget._config_save.flush()
+            assert save.call_count == 2
+
     def test_clear_search_history_option(self, widget, config_manager, qtbot):
         """Test clear search history functionality."""
         # Add some history
@@ -341,6 +415,50 @@ class TestSearchInputWidget:
         assert len(new_widget.search_history) == 0
 
 
+class TestDebouncedConfigSave:
+    """Test cases for the shared debounced configuration write."""
+
+    def test_requests_are_coalesced_into_one_write(self, qtbot):
+        """Test a burst of requests writes the configuration once."""
+        config = MagicMock()
+        save = DebouncedConfigSave(config, "test settings", 10)
+
+        save.schedule()
+        save.schedule()
+        assert save.is_pending()
+        qtbot.waitUntil(lambda: config.save.call_count == 1)
+
+        save.schedule()
+        save.flush()
+        assert config.save.call_count == 2
+        assert not save.is_pending()
+
+    def test_missing_config_skips_writes_quietly(self):
+        """Test requests without a config never write or log an error."""
+        save = DebouncedConfigSave(None, "test settings", 10)
+
+        with patch("filesearch.ui.search_controls.config_save.logger") as mock_logger:
+            save.schedule()
+            save.flush()
+
+        assert not save.is_pending()
+        mock_logger.error.assert_not_called()
+
+    def test_write_errors_are_logged(self):
+        """Test a failing write is reported instead of raised."""
+        config = MagicMock()
+        config.save.side_effect = OSError("disk full")
+        save = DebouncedConfigSave(config, "test settings", 10)
+
+        with patch("filesearch.ui.search_controls.config_save.logger") as mock_logger:
+            save.schedule()
+            save.flush()
+
+        mock_logger.error.assert_called_once_with(
+            "Error saving test settings: disk full"
+        )
+
+
 class TestDirectorySelectorWidget:
     """Test cases for DirectorySelectorWidget class."""
 
@@ -411,12 +529,35 @@ class TestDirectorySelectorWidget:
 
         assert event.isAccepted()
 
+    def test_enter_in_directory_input_emits_enter_pressed(self, widget, qtbot):
+        """Return and keypad Enter in the input request a search."""
+        for key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            with qtbot.waitSignal(widget.enter_pressed, timeout=1000):
+                qtbot.keyPress(widget.directory_input, key)
+
+    def test_enter_right_after_typing_announces_the_typed_path_first(
+        self, widget, qtbot, tmp_path
+    ):
+        """Enter flushes pending validation before requesting a search."""
+        events = []
+        widget.directory_changed.connect(lambda path: events.append(path))
+        widget.enter_pressed.connect(lambda: events.append("enter"))
+
+        widget.directory_input.clear()
+        events.clear()
+        qtbot.keyClicks(widget.directory_input, str(tmp_path))
+        qtbot.keyPress(widget.directory_input, Qt.Key.Key_Return)
+
+        assert events == [tmp_path.resolve(), "enter"]
+        assert not widget._validate_timer.isActive()
+
     def test_directory_changed_signal(self, widget, qtbot):
         """Test directory_changed signal emits correct Path object."""
         new_path = Path(SYNTHETIC_TMP_ROOT) / "test_new_dir"
 
+        widget.directory_input.clear()
         with qtbot.waitSignal(widget.directory_changed, timeout=1000) as blocker:
-            widget.directory_input.setText(str(new_path))
+            qtbot.keyClicks(widget.directory_input, str(new_path))
 
         assert blocker.args[0] == new_path.resolve()
 
@@ -492,6 +633,29 @@ class TestDirectorySelectorWidget:
         widget._clear_recent_history()
         assert widget.recent_directories == []
 
+    def test_recent_directories_menu_is_reused_until_list_changes(
+        self, widget, tmp_path
+    ):
+        """Test the recent menu is kept and repopulated only when stale."""
+        widget.recent_directories = [str(tmp_path)]
+
+        menu = widget._recent_menu()
+        actions = menu.actions()
+        assert widget._recent_menu() is menu
+        assert menu.actions() == actions
+
+        widget._clear_recent_history()
+        assert widget._recent_menu() is menu
+        assert [a.text() for a in menu.actions()] == ["No recent directories"]
+
+    def test_recent_directories_menu_action_sets_directory(self, widget, tmp_path):
+        """Test choosing a recent entry switches to that directory."""
+        widget.recent_directories = [str(tmp_path)]
+
+        widget._recent_menu().actions()[0].trigger()
+
+        assert widget.get_directory() == tmp_path
+
     def test_path_validation_and_error_state(self, widget, qtbot, mock_path_utils):
         """Test path validation updates error state and tooltip (AC #2)."""
         _mock_normalize, mock_validate = mock_path_utils
@@ -500,8 +664,8 @@ class TestDirectorySelectorWidget:
         mock_validate.return_value = "Directory does not exist."
         qtbot.keyClicks(widget.directory_input, "/nonexistent/path")
 
-        # Check error state
-        assert widget.directory_input.property("state") == "error"
+        # Check error state once typing pauses
+        qtbot.waitUntil(lambda: widget.directory_input.property("state") == "error")
         assert widget.directory_input.toolTip() == "Directory does not exist."
 
         # 2. Test valid path
@@ -510,17 +674,65 @@ class TestDirectorySelectorWidget:
         qtbot.keyClicks(widget.directory_input, str(Path.home()))
 
         # Check normal state
+        qtbot.waitUntil(
+            lambda: widget.directory_input.toolTip() == str(Path.home().resolve())
+        )
         assert widget.directory_input.property("state") == "normal"
-        assert widget.directory_input.toolTip() == str(Path.home().resolve())
+
+    def test_typed_path_is_validated_once_typing_pauses(
+        self, widget, qtbot, mock_path_utils
+    ):
+        """Test keystrokes are coalesced into a single validation."""
+        _mock_normalize, mock_validate = mock_path_utils
+        mock_validate.return_value = None
+        mock_validate.reset_mock()
+
+        widget.directory_input.clear()
+        with qtbot.waitSignal(widget.directory_changed, timeout=1000):
+            qtbot.keyClicks(widget.directory_input, "/some/typed/path")
+
+        assert mock_validate.call_count == 1
+
+    def test_programmatic_set_validates_once(self, widget, mock_path_utils, tmp_path):
+        """Test set_directory validates synchronously without a pending retry."""
+        _mock_normalize, mock_validate = mock_path_utils
+        mock_validate.reset_mock()
+
+        widget.set_directory(tmp_path)
+
+        assert mock_validate.call_count == 1
+        assert not widget._validate_timer.isActive()
+
+    def test_programmatic_set_announces_directory_once(self, widget, qtbot, tmp_path):
+        """Test set_directory emits directory_changed a single time."""
+        emitted = []
+        widget.directory_changed.connect(emitted.append)
+
+        widget.set_directory(tmp_path)
+        qtbot.wait(widget.VALIDATION_DELAY_MS + 50)
+
+        assert emitted == [tmp_path.resolve()]
+
+    def test_completion_pick_is_validated(self, widget, qtbot, mock_path_utils):
+        """Test choosing a completion validates like typed input."""
+        _mock_normalize, mock_validate = mock_path_utils
+        mock_validate.reset_mock()
+
+        with qtbot.waitSignal(widget.directory_changed, timeout=1000):
+            widget.directory_input.completer().activated.emit(str(Path.home()))
+
+        assert mock_validate.call_count == 1
 
     def test_path_normalization_on_input(self, widget, qtbot, mock_path_utils):
         """Test input text is normalized before validation."""
         mock_normalize, _ = mock_path_utils
 
-        # Set text with a shortcut
-        widget.directory_input.setText("~")
+        # Type a shortcut
+        widget.directory_input.clear()
+        qtbot.keyClicks(widget.directory_input, "~")
 
-        # Check normalize_path was called
+        # Check normalize_path was called once typing pauses
+        qtbot.waitUntil(lambda: mock_normalize.called)
         mock_normalize.assert_called_with("~")
 
     def test_auto_complete_setup(self, widget):
@@ -545,6 +757,15 @@ class TestDirectorySelectorWidget:
             for recent in widget.recent_directories:
                 assert recent in items
 
+    def test_auto_complete_updates_in_place(self, widget, tmp_path):
+        """Test adding a recent directory refreshes the existing completer."""
+        completer = widget.directory_input.completer()
+
+        widget._add_to_recent_directories(tmp_path)
+
+        assert widget.directory_input.completer() is completer
+        assert str(tmp_path) in completer.model().stringList()
+
 
 class TestSearchControlWidget:
     """Test cases for SearchControlWidget class."""
@@ -580,6 +801,19 @@ class TestSearchControlWidget:
         assert widget.search_button.text() == "Search"
         assert widget.search_button.isEnabled() is True
 
+    def test_query_toggles_in_idle_skip_repolish(self, widget):
+        """Toggling the query while idle keeps the button's style state."""
+        style = widget.search_button.style()
+
+        with patch.object(style, "polish") as polish:
+            widget.set_query_empty(False)
+            widget.set_query_empty(True)
+            widget.set_query_empty(False)
+            widget.set_state(SearchState.RUNNING)
+
+        assert polish.call_count == 1
+        assert widget.search_button.property("state") == "stop"
+
     def test_state_transition_to_running(self, widget):
         """Test state transition to RUNNING."""
         widget.set_query_empty(False)
@@ -751,6 +985,46 @@ class TestProgressWidget:
         assert "test" in widget.progress_text.text()
         assert widget.file_counter.text() == "25 files scanned"
 
+    def test_rapid_progress_updates_are_coalesced(self, widget, qtbot):
+        """Updates within one interval are drawn once, with the latest values."""
+        widget.set_determinate_mode(1000)
+        widget.show_progress()
+        emitted = []
+        widget.progress_updated.connect(lambda n, d: emitted.append(n))
+
+        for count in range(1, 101):
+            widget.update_progress(count, f"/dir/{count}")
+
+        assert emitted == [1]
+        assert widget.file_counter.text() == "1 files scanned"
+
+        qtbot.waitUntil(lambda: emitted == [1, 100])
+        assert widget.file_counter.text() == "100 files scanned"
+
+    def test_completed_state_drops_pending_progress(self, widget, qtbot):
+        """A coalesced update does not overwrite the completed state."""
+        widget.show_progress()
+        widget.update_progress(1, "/a")
+        widget.update_progress(2, "/b")
+        widget.set_completed_state(2)
+
+        qtbot.wait(widget.PROGRESS_UPDATE_INTERVAL_MS * 2)
+        assert widget.progress_text.text() == "Search completed"
+
+    def test_unchanged_progress_mode_keeps_bar_range(self, widget):
+        """Re-applying the current mode does not reset the bar's range."""
+        widget.set_determinate_mode(100)
+
+        with patch.object(
+            widget.progress_bar, "setRange", wraps=widget.progress_bar.setRange
+        ) as set_range:
+            widget.set_determinate_mode(200)
+            widget.set_indeterminate_mode()
+            widget.set_indeterminate_mode()
+
+        set_range.assert_called_once_with(0, 0)
+        assert widget.total_files_estimate == 0
+
     def test_progress_visibility(self, widget):
         """Test progress show/hide functionality."""
         # Initially visible (from fixture)
@@ -775,6 +1049,21 @@ class TestProgressWidget:
         assert "Error: Permission denied" in widget.progress_text.text()
         assert widget.spinner_label.text() == "❌"
 
+    def test_spinner_reuses_prerendered_frames(self, widget):
+        """Spinner ticks swap cached pixmaps instead of re-shaping text."""
+        widget._animate_spinner()
+        frames = widget._spinner_frames()
+
+        assert widget._spinner_frames() is frames
+        assert len(frames) == 4
+        assert (
+            widget.spinner_label.pixmap().cacheKey()
+            == frames[widget.spinner_angle].cacheKey()
+        )
+
+        widget.set_error_state("Permission denied")
+        assert widget.spinner_label.text() == "❌"
+
     def test_completed_state(self, widget):
         """Test completed state display."""
         widget.set_determinate_mode(100)
@@ -928,6 +1217,34 @@ class TestStatusWidget:
             widget.update_status("completed", 10)
         assert blocker.args == ["completed", 10]
 
+    def test_completion_summary_is_written_after_the_handler(
+        self, desktop_effects, application_runtime, qtbot
+    ):
+        """Completion updates the config at once and writes the file later."""
+        config = ConfigManager(
+            app_name="test_filesearch",
+            app_author="test",
+            runtime=application_runtime,
+            watch_config=False,
+        )
+        widget = StatusWidget(config_manager=config, desktop_effects=desktop_effects)
+
+        with patch.object(config, "save") as save:
+            widget.update_status("completed", 3, query="a", duration=1.0)
+            widget.update_status("completed", 4, query="a", duration=1.0)
+
+            assert config.get("ui.last_search_summary") == (widget.summary_label.text())
+            assert save.call_count == 0
+            qtbot.waitUntil(lambda: save.call_count == 1)
+
+            # Repeating the previous search leaves the file untouched
+            widget.update_status("completed", 4, query="a", duration=1.0)
+            assert not widget._config_save.is_pending()
+
+            widget.update_status("completed", 5, query="a", duration=1.0)
+            widget._config_save.flush()
+            assert save.call_count == 2
+
     def test_status_history_basic(self, widget):
         """Test basic status history functionality."""
         # Update status
@@ -167,6 +167,19 @@ class TestSecurityManager:
             assert should_warn is False
             assert message == ""
 
+    def test_should_warn_allowed_extension_skips_file_checks(self):
+        """An allowed extension is decided without touching the filesystem."""
+        manager = SecurityManager()
+        manager._allowed_extensions.add(".exe")
+
+        with patch.object(manager, "is_executable") as mock_is_executable:
+            should_warn, message = manager.should_warn_before_opening(
+                Path("/remote/share/setup.EXE")
+            )
+
+        assert (should_warn, message) == (False, "")
+        mock_is_executable.assert_not_called()
+
     def test_should_warn_blocked_extension(self):
         """Test warning check for blocked executable extension."""
         manager = SecurityManager()
@@ -67,6 +67,14 @@ class TestSidebarWidgetLocations:
 
         assert widget._tag_buttons[0].toolTip() == query
 
+    def test_recent_search_tags_rotate_theme_tones(self, widget):
+        """Tag colours come from the theme rather than per-button stylesheets."""
+        widget.set_tags([f"tag{i}" for i in range(6)])
+
+        tones = [btn.property("tone") for btn in widget._tag_buttons]
+        assert tones == ["blue", "green", "purple", "yellow", "red", "blue"]
+        assert all(not btn.styleSheet() for btn in widget._tag_buttons)
+
 
 class TestSidebarWidgetStorage:
     """Tests for multi-drive storage indicators in the sidebar."""
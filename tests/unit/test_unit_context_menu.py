@@ -26,6 +26,17 @@ def search_results():
     ]
 
 
+def _bind_action_routing(window):
+    """Bind the real action routing methods to a mocked main window."""
+    window._context_handlers = None
+    window._context_action_handlers = MainWindow._context_action_handlers.__get__(
+        window, MainWindow
+    )
+    window._on_context_menu_action = MainWindow._on_context_menu_action.__get__(
+        window, MainWindow
+    )
+
+
 class TestContextMenuActionRouting:
     """Test the context menu action routing system."""
 
@@ -43,9 +54,7 @@ class TestContextMenuActionRouting:
         ]
 
         # Bind the actual method to our mock
-        window._on_context_menu_action = MainWindow._on_context_menu_action.__get__(
-            window, MainWindow
-        )
+        _bind_action_routing(window)
         window._handle_context_open = Mock()
         window.safe_status_message = Mock()
 
@@ -53,6 +62,20 @@ class TestContextMenuActionRouting:
         window._on_context_menu_action(window.ContextMenuAction.OPEN)
         window._handle_context_open.assert_called_once_with([search_results[0]])
 
+    def test_on_context_menu_action_uses_captured_selection(self, search_results):
+        """Test that a selection captured at menu-open time skips the view query."""
+
+        window = Mock(spec=MainWindow)
+        window.results_view = Mock()
+        _bind_action_routing(window)
+        window._handle_context_open = Mock()
+        window.safe_status_message = Mock()
+
+        window._on_context_menu_action(window.ContextMenuAction.OPEN, search_results)
+
+        window._handle_context_open.assert_called_once_with(search_results)
+        window.results_view.selectionModel.assert_not_called()
+
     def test_on_context_menu_action_invalid_selection(self):
         """Test handling when no items are selected."""
 
@@ -62,9 +85,7 @@ class TestContextMenuActionRouting:
         selection_model.selectedIndexes.return_value = []
         window.safe_status_message = Mock()
 
-        window._on_context_menu_action = MainWindow._on_context_menu_action.__get__(
-            window, MainWindow
-        )
+        _bind_action_routing(window)
 
         window._on_context_menu_action(window.ContextMenuAction.OPEN)
         window.safe_status_message.assert_called_with("No item selected for action.")
@@ -86,9 +107,7 @@ class TestContextMenuActionRouting:
         ]
         window.safe_status_message = Mock()
 
-        window._on_context_menu_action = MainWindow._on_context_menu_action.__get__(
-            window, MainWindow
-        )
+        _bind_action_routing(window)
         # Bind the handler to test its guard logic
         window._handle_context_properties = (
             MainWindow._handle_context_properties.__get__(window, MainWindow)
@@ -100,6 +119,25 @@ class TestContextMenuActionRouting:
             "Properties only supported for single selection."
         )
 
+    def test_action_handlers_are_built_once(self, search_results):
+        """Test repeated actions reuse the cached handler map."""
+
+        window = Mock(spec=MainWindow)
+        window.results_view = Mock()
+        window._handle_context_open = Mock()
+        window._handle_context_copy_path = Mock()
+        window.safe_status_message = Mock()
+        _bind_action_routing(window)
+
+        window._on_context_menu_action(window.ContextMenuAction.OPEN, search_results)
+        handlers = window._context_handlers
+        window._on_context_menu_action(
+            window.ContextMenuAction.COPY_PATH_TO_CLIPBOARD, search_results
+        )
+
+        assert window._context_handlers is handlers
+        window._handle_context_copy_path.assert_called_once_with(search_results)
+
 
 class TestContextMenuActionHandlers:
     """Test individual context menu action handlers."""
@@ -1,44 +1,106 @@
 """Behavioral tests for background worker signal contracts."""
 
+import threading
 from unittest.mock import Mock
 
 from filesearch.core.exceptions import FileSearchError, SearchError
+from filesearch.models.search_result import SearchResult
 from filesearch.ui.search_worker import SearchWorker
 from filesearch.ui.storage_worker import StorageWorker
 
 
-def test_search_worker_emits_results_progress_and_completion(tmp_path):
+def _result_dict(path, size=1, modified=0.0):
+    return {"path": str(path), "size": size, "modified": modified}
+
+
+def test_search_worker_emits_results_and_completion(tmp_path):
     engine = Mock()
-    engine.search.return_value = ({"name": f"file-{index}"} for index in range(10))
+    engine.search.return_value = (
+        _result_dict(tmp_path / f"file-{index}") for index in range(10)
+    )
     worker = SearchWorker(engine, tmp_path, "file")
     results = []
-    progress = []
     completed = []
-    worker.result_found.connect(lambda result, number: results.append((result, number)))
-    worker.progress_update.connect(
-        lambda percent, path, count: progress.append((percent, path, count))
+    worker.signals.results_found.connect(
+        lambda batch, total: results.append((batch, total))
+    )
+    worker.signals.search_complete.connect(
+        lambda files, dirs: completed.append((files, dirs))
     )
-    worker.search_complete.connect(lambda files, dirs: completed.append((files, dirs)))
 
     worker.run()
 
-    assert results[-1] == ({"name": "file-9"}, 10)
-    assert progress == [(50, str(tmp_path), 10)]
+    assert len(results) == 1
+    batch, total = results[0]
+    assert total == 10
+    assert batch[-1] == SearchResult(tmp_path / "file-9", 1, 0.0)
     assert completed == [(10, 0)]
 
 
+def test_search_worker_flushes_full_batches(tmp_path):
+    engine = Mock()
+    count = SearchWorker.BATCH_SIZE * 2 + 3
+    engine.search.return_value = (
+        _result_dict(tmp_path / f"file-{index}") for index in range(count)
+    )
+    worker = SearchWorker(engine, tmp_path, "file")
+    worker.BATCH_INTERVAL = 60.0
+    batches = []
+    worker.signals.results_found.connect(
+        lambda batch, total: batches.append((batch, total))
+    )
+
+    worker.run()
+
+    assert [len(batch) for batch, _total in batches] == [
+        SearchWorker.BATCH_SIZE,
+        SearchWorker.BATCH_SIZE,
+        3,
+    ]
+    assert [total for _batch, total in batches] == [
+        SearchWorker.BATCH_SIZE,
+        SearchWorker.BATCH_SIZE * 2,
+        count,
+    ]
+
+
+def test_search_worker_flushes_a_match_during_a_quiet_stretch(tmp_path, qtbot):
+    engine = Mock()
+    walk_resumed = threading.Event()
+
+    def sparse_results():
+        yield _result_dict(tmp_path / "first")
+        # Nothing else matches for a long stretch of the walk
+        walk_resumed.wait(5)
+
+    engine.search.return_value = sparse_results()
+    worker = SearchWorker(engine, tmp_path, "file")
+
+    try:
+        with qtbot.waitSignal(worker.signals.results_found, timeout=1000) as blocker:
+            worker.start()
+        assert not walk_resumed.is_set()
+    finally:
+        walk_resumed.set()
+        assert worker.wait(5) is True
+
+    assert blocker.args == [[SearchResult(tmp_path / "first", 1, 0.0)], 1]
+
+
 def test_search_worker_stop_cancels_search_and_emits_stopped(tmp_path):
     engine = Mock()
     worker = SearchWorker(engine, tmp_path, "file")
 
     def results_stopping_after_first():
-        yield {"name": "first"}
+        yield _result_dict(tmp_path / "first")
         worker.stop()
-        yield {"name": "ignored"}
+        yield _result_dict(tmp_path / "ignored")
 
     engine.search.return_value = results_stopping_after_first()
     stopped = []
-    worker.search_stopped.connect(lambda files, dirs: stopped.append((files, dirs)))
+    worker.signals.search_stopped.connect(
+        lambda files, dirs: stopped.append((files, dirs))
+    )
 
     worker.run()
 
@@ -50,7 +112,9 @@ def test_search_worker_distinguishes_expected_and_unexpected_errors(tmp_path):
     engine = Mock()
     worker = SearchWorker(engine, tmp_path, "file")
     errors = []
-    worker.error_occurred.connect(lambda message, code: errors.append((message, code)))
+    worker.signals.error_occurred.connect(
+        lambda message, code: errors.append((message, code))
+    )
 
     engine.search.side_effect = FileSearchError("search failed")
     worker.run()
@@ -117,3 +181,47 @@ def test_storage_worker_stop_requests_cancellation(tmp_path):
     worker.stop()
 
     analyzer.cancel.assert_called_once_with()
+
+
+def test_search_worker_honours_stop_requested_before_run(tmp_path):
+    engine = Mock()
+    engine.search.return_value = iter([_result_dict(tmp_path / "first")])
+    worker = SearchWorker(engine, tmp_path, "file")
+    batches = []
+    stopped = []
+    worker.signals.results_found.connect(lambda batch, total: batches.append(batch))
+    worker.signals.search_stopped.connect(
+        lambda files, dirs: stopped.append((files, dirs))
+    )
+
+    worker.stop()
+    worker.run()
+
+    assert batches == []
+    assert stopped == [(0, 0)]
+
+
+def test_search_worker_start_runs_on_thread_pool(tmp_path):
+    engine = Mock()
+    engine.search.return_value = iter([])
+    worker = SearchWorker(engine, tmp_path, "file")
+
+    worker.start()
+
+    assert worker.wait(5) is True
+    engine.search.assert_called_once_with(tmp_path, "file")
+
+
+def test_search_worker_carries_directory_flag_from_engine(tmp_path):
+    engine = Mock()
+    engine.search.return_value = iter(
+        [{**_result_dict(tmp_path / "missing-dir", size=0), "is_directory": True}]
+    )
+    worker = SearchWorker(engine, tmp_path, "missing")
+    batches = []
+    worker.signals.results_found.connect(lambda batch, total: batches.append(batch))
+
+    worker.run()
+
+    # The path does not exist, so True can only come from the engine's flag.
+    assert batches[0][0].is_directory is True